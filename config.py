@@ -29,6 +29,7 @@ class AppConfig:
     PROJECT_ROOT = Path(__file__).parent.absolute()
     EXPORTS_DIR = PROJECT_ROOT / 'exports'
     LOGS_DIR = PROJECT_ROOT / 'logs'
+    CACHE_DIR = PROJECT_ROOT / 'cache'
     STATIC_DIR = PROJECT_ROOT / 'static'
     TEMPLATES_DIR = PROJECT_ROOT / 'templates'
     
@@ -83,7 +84,7 @@ class AppConfig:
     @classmethod
     def init_directories(cls):
         """Crée les dossiers nécessaires"""
-        for directory in [cls.EXPORTS_DIR, cls.LOGS_DIR]:
+        for directory in [cls.EXPORTS_DIR, cls.LOGS_DIR, cls.CACHE_DIR]:
             directory.mkdir(exist_ok=True)
 
 
@@ -674,6 +675,21 @@ class OSMConfig:
         'user_agent': f'{AppConfig.NAME}/{AppConfig.VERSION}'
     }
     
+    # Cache disque des réponses Overpass (clé = SHA-256 de la requête)
+    CACHE_CONFIG = {
+        'enabled': True,
+        'directory': AppConfig.CACHE_DIR / 'overpass',
+        'ttl_seconds': 24 * 3600
+    }
+    
+    # Découpage en tuiles des relations à l'échelle du pays (une requête
+    # unique dépasse le timeout Overpass)
+    TILING_CONFIG = {
+        'zones': ['malaysia'],
+        'grid_size': 4,
+        'max_workers': 2
+    }
+    
     # Endpoints API
     API_ENDPOINTS = {
         'overpass_primary': 'https://overpass-api.de/api/interpreter',
@@ -734,7 +750,7 @@ class MathConstants:
     # Constantes physiques
     EARTH_RADIUS_KM = 6371.0
     DEGREES_TO_RADIANS = 0.017453292519943295
-    METERS_PER_DEGREE_LAT = 111000
+    METERS_PER_DEGREE_LAT = 111320.0  # 1° de latitude (et de longitude à l'équateur)
     
     # Facteurs de conversion
     CONVERSION = {
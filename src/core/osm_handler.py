@@ -10,19 +10,229 @@ pour les générateurs electricity_generator.py et water_generator.py
 
 import requests
 import json
+import gzip
+import hashlib
+import random
 import time
 import logging
 import math
-from typing import Dict, List, Optional, Tuple
+import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import MathConstants, OSMConfig
+
+try:
+    # Décodage JSON natif (2-5x plus rapide sur les grosses réponses Overpass)
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Longueur d'un degré de latitude (et de longitude à l'équateur) en mètres
+_METERS_PER_DEGREE = MathConstants.METERS_PER_DEGREE_LAT
+
+# Emprise Malaysia (sud, ouest, nord, est) pour la validation des coordonnées
+_MALAYSIA_BBOX = (0.5, 99.0, 7.5, 120.0)
+
+
+def _coordinate_or_nan(value) -> float:
+    """Coordonnée en float, NaN si la valeur n'est pas numérique"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _coordinates_array(values: List) -> np.ndarray:
+    """
+    Tableau float64 de coordonnées brutes OSM
+    
+    Les valeurs absentes ou non numériques deviennent NaN (conversion valeur
+    par valeur seulement si la conversion directe du lot échoue).
+    
+    Args:
+        values: Coordonnées brutes (float, str numérique, None, ...)
+        
+    Returns:
+        np.ndarray: Coordonnées, NaN pour les valeurs inexploitables
+    """
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([_coordinate_or_nan(value) for value in values], dtype=np.float64)
+
+
+# Filtre des éléments OSM (rejet avant tout calcul géométrique)
+_BUILDING_ELEMENT_TYPES = frozenset(('way', 'relation'))
+_NON_BUILDING_TAGS = frozenset(('no', 'false'))
+
+# Type normalisé par tag building OSM
+_BUILDING_TYPE_MAPPING = {
+    # Résidentiel
+    'house': 'residential',
+    'detached': 'residential', 
+    'semi_detached': 'residential',
+    'terrace': 'residential',
+    'apartments': 'residential',
+    'residential': 'residential',
+    'dormitory': 'residential',
+    'bungalow': 'residential',
+    
+    # Commercial
+    'retail': 'commercial',
+    'shop': 'commercial',
+    'commercial': 'commercial',
+    'supermarket': 'commercial',
+    'mall': 'commercial',
+    'kiosk': 'commercial',
+    
+    # Bureau
+    'office': 'office',
+    'government': 'office',
+    'civic': 'office',
+    
+    # Industriel
+    'industrial': 'industrial',
+    'warehouse': 'industrial',
+    'factory': 'industrial',
+    'manufacture': 'industrial',
+    
+    # Éducation
+    'school': 'school',
+    'university': 'school',
+    'college': 'school',
+    'kindergarten': 'school',
+    
+    # Santé
+    'hospital': 'hospital',
+    'clinic': 'hospital',
+    'healthcare': 'hospital',
+    
+    # Autres
+    'hotel': 'commercial',
+    'restaurant': 'commercial',
+    'church': 'office',
+    'mosque': 'office',
+    'temple': 'office'
+}
+
+# Type normalisé par tag amenity (pour building=yes)
+_AMENITY_TYPE_MAPPING = {
+    'school': 'school',
+    'university': 'school',
+    'college': 'school',
+    'kindergarten': 'school',
+    'hospital': 'hospital',
+    'clinic': 'hospital',
+    'doctors': 'hospital',
+    'restaurant': 'commercial',
+    'cafe': 'commercial',
+    'fast_food': 'commercial',
+    'bar': 'commercial',
+    'pub': 'commercial',
+    'bank': 'office',
+    'post_office': 'office',
+    'police': 'office',
+    'fire_station': 'office'
+}
+
+# Type normalisé par tag landuse (pour building=yes)
+_LANDUSE_TYPE_MAPPING = {
+    'residential': 'residential',
+    'industrial': 'industrial',
+    'commercial': 'commercial'
+}
+
+# Relations administratives OSM par zone (clés en minuscules, table figée)
+_ADMIN_RELATIONS = MappingProxyType({
+    # PAYS
+    'malaysia': 2108121,
+    
+    # TERRITOIRES FÉDÉRAUX
+    'kuala_lumpur': 2939672,
+    'putrajaya': 4443881,
+    'labuan': 4521286,
+    
+    # ÉTATS
+    'selangor': 2932285,
+    'johor': 2939653,
+    'penang': 4445131,
+    'perak': 4445076,
+    'sabah': 3879783,
+    'sarawak': 3879784,
+    'kedah': 4444908,
+    'kelantan': 4443571,
+    'terengganu': 4444411,
+    'pahang': 4444595,
+    'perlis': 4444918,
+    'negeri_sembilan': 2939674,
+    'melaka': 2939673,
+    
+    # VILLES PRINCIPALES
+    'shah_alam': 1876116,
+    'petaling_jaya': 1876117,
+    'subang_jaya': 1876118,
+    'klang': 1876119,
+    'johor_bahru': 1876100,
+    'iskandar_puteri': 1876101,
+    'george_town': 4445132,
+    'butterworth': 4445133,
+    'ipoh': 4445077,
+    'taiping': 4445078,
+    'alor_setar': 4444909,
+    'kota_bharu': 4443572,
+    'kuala_terengganu': 4444412,
+    'kuantan': 4444596,
+    'kangar': 4444919,
+    'seremban': 2939675,
+    'malacca_city': 2939680,
+    'kota_kinabalu': 3879785,
+    'kuching': 3879786,
+    'sandakan': 3879787,
+    'tawau': 3879788,
+    'miri': 3879790,
+    'sibu': 3879791,
+    'bintulu': 3879792
+})
+
+
+class JitteredRetry(Retry):
+    """
+    Politique Retry urllib3 avec jitter aléatoire sur le backoff exponentiel
+    
+    Évite que plusieurs workers en échec simultané ne relancent Overpass en
+    même temps (cascade de 429). Un Retry-After explicite reste prioritaire.
+    """
+    
+    BACKOFF_MAX_SECONDS = 30
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(self.BACKOFF_MAX_SECONDS, backoff * (1 + random.random() * 0.5))
+
 
 class EnhancedOSMHandler:
     """
     Gestionnaire OSM amélioré avec extraction géométrique précise
     """
     
+    __slots__ = (
+        'session', 'overpass_apis', 'request_timeout',
+        'breaker_threshold', 'breaker_cooldown_seconds', '_breaker', '_breaker_lock',
+        'administrative_relations'
+    )
+    
     def __init__(self):
         """Initialise le gestionnaire OSM amélioré"""
         self.session = requests.Session()
@@ -30,6 +240,23 @@ class EnhancedOSMHandler:
             'User-Agent': 'Malaysia-Enhanced-Building-Generator/3.0'
         })
         
+        # Pool de connexions keep-alive + retry urllib3 (backoff exponentiel avec
+        # jitter, respect de l'en-tête Retry-After renvoyé par Overpass sur 429):
+        # jusqu'à 3 nouvelles tentatives (4 envois au plus) sur erreur de connexion
+        # ou 429/502/503/504. Jamais sur timeout de lecture: un miroir qui ne
+        # répond pas est abandonné au premier timeout au profit du suivant
+        retry_policy = JitteredRetry(
+            total=3,
+            read=False,
+            backoff_factor=1,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry_policy)
+        self.session.mount('https://', adapter)
+        
         # APIs Overpass
         self.overpass_apis = [
             'https://overpass-api.de/api/interpreter',
@@ -37,70 +264,37 @@ class EnhancedOSMHandler:
             'https://lz4.overpass-api.de/api/interpreter'
         ]
         
-        # Cache pour les relations administratives
-        self.administrative_relations = {
-            # PAYS
-            'malaysia': 2108121,          
-            
-            # TERRITOIRES FÉDÉRAUX 
-            'kuala_lumpur': 2939672,       
-            'putrajaya': 4443881,          
-            'labuan': 4521286,             
-            
-            # ÉTATS 
-            'selangor': 2932285,           
-            'johor': 2939653,              
-            'penang': 4445131,             
-            'perak': 4445076,              
-            'sabah': 3879783,              
-            'sarawak': 3879784,            
-            'kedah': 4444908,              
-            'kelantan': 4443571,           
-            'terengganu': 4444411,         
-            'pahang': 4444595,             
-            'perlis': 4444918,             
-            'negeri_sembilan': 2939674,    
-            'melaka': 2939673,             
-            
-            # VILLES PRINCIPALES
-            'shah_alam': 1876116,
-            'petaling_jaya': 1876117,
-            'subang_jaya': 1876118,
-            'klang': 1876119,
-            'johor_bahru': 1876100,
-            'iskandar_puteri': 1876101,
-            'george_town': 4445132,
-            'butterworth': 4445133,
-            'ipoh': 4445077,
-            'taiping': 4445078,
-            'alor_setar': 4444909,
-            'kota_bharu': 4443572,
-            'kuala_terengganu': 4444412,
-            'kuantan': 4444596,
-            'kangar': 4444919,
-            'seremban': 2939675,
-            'malacca_city': 2939680,
-            'kota_kinabalu': 3879785,
-            'kuching': 3879786,
-            'sandakan': 3879787,
-            'tawau': 3879788,
-            'miri': 3879790,
-            'sibu': 3879791,
-            'bintulu': 3879792
-        }
+        # Timeouts (connexion, lecture): un miroir injoignable échoue en quelques
+        # secondes au lieu de bloquer 300s avant de passer au suivant
+        self.request_timeout = (10, 300)
+        
+        # Disjoncteur par miroir: après 3 échecs consécutifs, le miroir est
+        # ignoré pendant 60s puis retenté une fois (état semi-ouvert)
+        self.breaker_threshold = 3
+        self.breaker_cooldown_seconds = 60
+        self._breaker = {url: {'failures': 0, 'opened_at': 0.0} for url in self.overpass_apis}
+        # Les tuiles parallèles partagent le disjoncteur: lectures/écritures sous verrou
+        self._breaker_lock = threading.Lock()
+        
+        # Relations administratives (table partagée au niveau du module)
+        self.administrative_relations = _ADMIN_RELATIONS
         
         logger.info("✅ EnhancedOSMHandler initialisé - Extraction géométrique complète")
     
-    def fetch_buildings_administrative(self, zone_name: str) -> Dict:
+    def fetch_buildings_administrative(self, zone_name: str, keep_geometry: bool = True) -> Dict:
         """
         MÉTHODE ADMINISTRATIVE AMÉLIORÉE: Extrait polygones complets et métadonnées étages
         
         Args:
             zone_name: Nom de la zone (ex: 'penang', 'kuala_lumpur')
+            keep_geometry: Conserver les polygones et tags bruts dans chaque bâtiment
             
         Returns:
             Dict: Résultat avec bâtiments enrichis (géométrie + étages)
         """
+        if zone_name.lower() in OSMConfig.TILING_CONFIG['zones']:
+            return self.fetch_buildings_administrative_tiled(zone_name, keep_geometry)
+        
         start_time = time.time()
         
         logger.info(f"🏗️ Méthode administrative améliorée pour: {zone_name}")
@@ -123,11 +317,13 @@ class EnhancedOSMHandler:
         
         try:
             osm_data = self._execute_query(query.strip())
-            elements = osm_data.get('elements', [])
+            elements = osm_data.pop('elements', [])
+            total_elements = len(elements)
+            del osm_data
             
-            logger.info(f"📋 Éléments OSM reçus: {len(elements):,}")
+            logger.info(f"📋 Éléments OSM reçus: {total_elements:,}")
             
-            if len(elements) == 0:
+            if total_elements == 0:
                 logger.warning("⚠️ Relation administrative trouvée mais aucun bâtiment")
                 return {
                     'success': False,
@@ -137,10 +333,13 @@ class EnhancedOSMHandler:
                 }
             
             # Traitement amélioré avec extraction géométrique complète
-            buildings = self._process_enhanced_buildings_data(elements, zone_name)
+            buildings = self._process_enhanced_buildings_data(elements, zone_name, keep_geometry)
+            
+            # Libère les éléments bruts avant le calcul des statistiques
+            del elements
             
             # Statistiques de traitement
-            processing_stats = self._calculate_processing_statistics(buildings, elements)
+            processing_stats = self._calculate_processing_statistics(buildings, total_elements)
             
             logger.info(f"🏗️ Bâtiments traités (amélioré): {len(buildings):,}")
             logger.info(f"📐 Avec géométrie précise: {processing_stats['with_geometry_count']}")
@@ -149,7 +348,7 @@ class EnhancedOSMHandler:
             return {
                 'success': True,
                 'buildings': buildings,
-                'total_elements': len(elements),
+                'total_elements': total_elements,
                 'query_time_seconds': time.time() - start_time,
                 'method_used': 'administrative_enhanced',
                 'relation_id': relation_id,
@@ -173,139 +372,418 @@ class EnhancedOSMHandler:
                 'relation_id': relation_id
             }
     
-    def _build_enhanced_overpass_query(self, relation_id: int) -> str:
+    def fetch_buildings_administrative_tiled(self, zone_name: str, keep_geometry: bool = True) -> Dict:
+        """
+        Variante découpée en tuiles pour les relations à l'échelle du pays
+        
+        L'emprise de la relation est découpée en une grille de sous-emprises,
+        interrogées en parallèle (nombre de workers limité pour respecter la
+        politique d'usage d'Overpass). Les bâtiments à cheval sur plusieurs
+        tuiles sont dédoublonnés par identifiant OSM.
+        
+        Args:
+            zone_name: Nom de la zone (ex: 'malaysia')
+            keep_geometry: Conserver les polygones et tags bruts dans chaque bâtiment
+            
+        Returns:
+            Dict: Résultat au même format que fetch_buildings_administrative
+        """
+        start_time = time.time()
+        
+        relation_id = self.administrative_relations.get(zone_name.lower())
+        
+        if not relation_id:
+            logger.error(f"❌ Pas de relation administrative OSM pour {zone_name}")
+            return {
+                'success': False,
+                'error': f"Relation administrative non disponible pour {zone_name}",
+                'buildings': [],
+                'available_zones': list(self.administrative_relations.keys())
+            }
+        
+        grid_size = OSMConfig.TILING_CONFIG['grid_size']
+        max_workers = OSMConfig.TILING_CONFIG['max_workers']
+        
+        logger.info(f"🧩 Méthode administrative en tuiles ({grid_size}x{grid_size}) pour: {zone_name}")
+        
+        try:
+            # Emprise de la relation (requête légère)
+            bounds_data = self._execute_query(f"[out:json][timeout:60];\nrelation({relation_id});\nout bb;")
+            bounds = bounds_data['elements'][0]['bounds']
+            
+            tiles = self._split_bbox(
+                (bounds['minlat'], bounds['minlon'], bounds['maxlat'], bounds['maxlon']),
+                grid_size
+            )
+            queries = [self._build_enhanced_overpass_query(relation_id, tile).strip() for tile in tiles]
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                tile_results = list(executor.map(self._execute_query, queries))
+            
+            # Fusion avec dédoublonnage des éléments partagés entre tuiles
+            elements_by_id = {}
+            for tile_data in tile_results:
+                for element in tile_data.get('elements', []):
+                    elements_by_id[(element.get('type'), element.get('id'))] = element
+            del tile_results
+            
+            elements = list(elements_by_id.values())
+            del elements_by_id
+            total_elements = len(elements)
+            
+            logger.info(f"📋 Éléments OSM reçus ({len(tiles)} tuiles, dédoublonnés): {total_elements:,}")
+            
+            if total_elements == 0:
+                logger.warning("⚠️ Relation administrative trouvée mais aucun bâtiment")
+                return {
+                    'success': False,
+                    'error': "Relation administrative valide mais sans bâtiments",
+                    'buildings': [],
+                    'relation_id': relation_id
+                }
+            
+            buildings = self._process_enhanced_buildings_data(elements, zone_name, keep_geometry)
+            del elements
+            
+            processing_stats = self._calculate_processing_statistics(buildings, total_elements)
+            
+            logger.info(f"🏗️ Bâtiments traités (tuiles): {len(buildings):,}")
+            
+            return {
+                'success': True,
+                'buildings': buildings,
+                'total_elements': total_elements,
+                'query_time_seconds': time.time() - start_time,
+                'method_used': 'administrative_tiled',
+                'relation_id': relation_id,
+                'processing_statistics': processing_stats,
+                'metadata': {
+                    'zone_name': zone_name,
+                    'method': 'administrative_tiled',
+                    'relation_id': relation_id,
+                    'tiles_count': len(tiles),
+                    'query_time_seconds': time.time() - start_time,
+                    'geometry_extraction': True,
+                    'floors_extraction': True
+                }
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur méthode administrative en tuiles: {e}")
+            return {
+                'success': False,
+                'error': f"Erreur administrative (tuiles): {str(e)}",
+                'buildings': [],
+                'relation_id': relation_id
+            }
+    
+    @staticmethod
+    def _split_bbox(bbox: Tuple[float, float, float, float], grid_size: int) -> List[Tuple[float, float, float, float]]:
+        """
+        Découpe une emprise (sud, ouest, nord, est) en grille régulière
+        
+        Args:
+            bbox: Emprise à découper
+            grid_size: Nombre de tuiles par côté
+            
+        Returns:
+            List[Tuple]: Sous-emprises (sud, ouest, nord, est)
+        """
+        south, west, north, east = bbox
+        lat_step = (north - south) / grid_size
+        lon_step = (east - west) / grid_size
+        
+        return [
+            (south + i * lat_step, west + j * lon_step,
+             south + (i + 1) * lat_step, west + (j + 1) * lon_step)
+            for i in range(grid_size)
+            for j in range(grid_size)
+        ]
+    
+    def _build_enhanced_overpass_query(self, relation_id: int,
+                                       tile_bbox: Optional[Tuple[float, float, float, float]] = None) -> str:
         """
         Construit une requête Overpass améliorée pour extraire plus de métadonnées
         
         Args:
             relation_id: ID de la relation OSM
+            tile_bbox: Sous-emprise (sud, ouest, nord, est) optionnelle
             
         Returns:
             str: Requête Overpass optimisée
         """
-        query = f"""[out:json][timeout:300];
+        south, west, north, east = _MALAYSIA_BBOX
+        
+        # Filtre de tuile appliqué aux bâtiments seulement (la relation
+        # administrative doit rester sélectionnée pour map_to_area)
+        tile_filter = ''
+        if tile_bbox:
+            tile_filter = '({:.6f},{:.6f},{:.6f},{:.6f})'.format(*tile_bbox)
+        
+        # L'emprise globale écarte côté serveur les bâtiments que la
+        # validation des coordonnées rejetterait de toute façon
+        query = f"""[out:json][timeout:300][bbox:{south},{west},{north},{east}];
 relation({relation_id});
 map_to_area->.admin_area;
 (
-  way["building"](area.admin_area);
-  relation["building"](area.admin_area);
+  way["building"](area.admin_area){tile_filter};
+  relation["building"](area.admin_area){tile_filter};
 );
 out geom tags;"""
         
         return query
     
-    def _execute_query(self, query: str, max_retries: int = 3) -> Dict:
+    def _execute_query(self, query: str) -> Dict:
         """
-        Exécute une requête Overpass avec retry amélioré
+        Exécute une requête Overpass sur chaque miroir jusqu'au premier succès
+        
+        Les tentatives répétées sur un même miroir sont gérées par la politique
+        Retry montée sur la session. Une réponse HTTP 200 portant un 'remark'
+        Overpass (erreur d'exécution, résultat tronqué) compte comme un échec
+        et n'est jamais mise en cache.
         
         Args:
             query: Requête Overpass
-            max_retries: Nombre maximum de tentatives
             
         Returns:
             Dict: Données OSM
         """
+        cache_key = hashlib.sha256(query.encode('utf-8')).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None and not cached.get('remark'):
+            return cached
+        
         last_error = None
         
         for api_url in self.overpass_apis:
-            for attempt in range(max_retries):
-                try:
-                    logger.info(f"🌐 Tentative {attempt + 1}/{max_retries} sur {api_url}")
-                    
-                    response = self.session.post(
-                        api_url,
-                        data=query,
-                        timeout=300,
-                        headers={'Content-Type': 'text/plain; charset=utf-8'}
-                    )
-                    
-                    logger.info(f"📡 Statut HTTP: {response.status_code}")
-                    logger.info(f"📊 Taille réponse: {len(response.content):,} bytes")
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        elements_count = len(result.get('elements', []))
-                        logger.info(f"✅ Succès: {elements_count:,} éléments reçus")
-                        return result
-                    else:
-                        logger.warning(f"⚠️ HTTP {response.status_code}: {response.text[:200]}")
-                        last_error = f"HTTP {response.status_code}"
-                        
-                except requests.exceptions.Timeout:
-                    logger.warning(f"⏱️ Timeout sur {api_url}")
-                    last_error = "Timeout"
+            if not self._breaker_try_acquire(api_url):
+                logger.info(f"⛔ Miroir ignoré (disjoncteur ouvert): {api_url}")
+                last_error = last_error or "Disjoncteur ouvert sur tous les miroirs"
+                continue
+            
+            try:
+                logger.info(f"🌐 Requête sur {api_url}")
+                
+                response = self.session.post(
+                    api_url,
+                    data=query,
+                    timeout=self.request_timeout,
+                    headers={'Content-Type': 'text/plain; charset=utf-8'}
+                )
+                
+                logger.info(f"📡 Statut HTTP: {response.status_code}")
+                logger.info(f"📊 Taille réponse: {len(response.content):,} bytes")
+                
+                if response.status_code == 200:
+                    result = _json_loads(response.content)
                     
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"🌐 Erreur réseau sur {api_url}: {e}")
-                    last_error = f"Erreur réseau: {e}"
+                    # Erreur d'exécution Overpass (timeout, mémoire) renvoyée en HTTP 200
+                    # avec un 'remark' et des éléments tronqués: ni cache ni succès
+                    remark = result.get('remark')
+                    if remark:
+                        logger.warning(f"⚠️ Résultat incomplet de {api_url}: {str(remark)[:200]}")
+                        last_error = f"Résultat incomplet: {str(remark)[:200]}"
+                        self._breaker_record(api_url, success=False)
+                        continue
                     
-                except json.JSONDecodeError as e:
-                    logger.warning(f"📄 JSON invalide de {api_url}: {e}")
-                    last_error = f"JSON invalide: {e}"
+                    elements_count = len(result.get('elements', []))
+                    logger.info(f"✅ Succès: {elements_count:,} éléments reçus")
+                    self._breaker_record(api_url, success=True)
+                    self._cache_put(cache_key, response.content)
+                    return result
+                else:
+                    logger.warning(f"⚠️ HTTP {response.status_code}: {response.text[:200]}")
+                    last_error = f"HTTP {response.status_code}"
                     
-                except Exception as e:
-                    logger.warning(f"❌ Erreur inattendue sur {api_url}: {e}")
-                    last_error = f"Erreur inattendue: {e}"
+            except requests.exceptions.Timeout:
+                logger.warning(f"⏱️ Timeout sur {api_url}")
+                last_error = "Timeout"
+                
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"🌐 Erreur réseau sur {api_url}: {e}")
+                last_error = f"Erreur réseau: {e}"
+                
+            except json.JSONDecodeError as e:
+                logger.warning(f"📄 JSON invalide de {api_url}: {e}")
+                last_error = f"JSON invalide: {e}"
                 
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Backoff exponentiel
+            except Exception as e:
+                logger.warning(f"❌ Erreur inattendue sur {api_url}: {e}")
+                last_error = f"Erreur inattendue: {e}"
+            
+            self._breaker_record(api_url, success=False)
         
         raise Exception(f"Toutes les APIs Overpass ont échoué. Dernière erreur: {last_error}")
     
-    def _process_enhanced_buildings_data(self, elements: List[Dict], zone_name: str) -> List[Dict]:
+    def _breaker_try_acquire(self, api_url: str) -> bool:
+        """
+        Indique si un miroir peut être interrogé selon son disjoncteur
+        
+        Disjoncteur ouvert et délai écoulé: un seul appelant obtient l'essai
+        semi-ouvert (le délai est réarmé sous verrou pour les autres).
+        
+        Args:
+            api_url: URL du miroir
+            
+        Returns:
+            bool: True si la requête peut être envoyée
+        """
+        with self._breaker_lock:
+            breaker = self._breaker.setdefault(api_url, {'failures': 0, 'opened_at': 0.0})
+            if breaker['failures'] < self.breaker_threshold:
+                return True
+            
+            now = time.time()
+            if now - breaker['opened_at'] < self.breaker_cooldown_seconds:
+                return False
+            
+            breaker['opened_at'] = now
+            return True
+    
+    def _breaker_record(self, api_url: str, success: bool):
+        """
+        Enregistre le résultat d'une requête dans le disjoncteur du miroir
+        
+        Args:
+            api_url: URL du miroir
+            success: True si la requête a abouti
+        """
+        with self._breaker_lock:
+            breaker = self._breaker.setdefault(api_url, {'failures': 0, 'opened_at': 0.0})
+            if success:
+                breaker['failures'] = 0
+            else:
+                breaker['failures'] += 1
+                breaker['opened_at'] = time.time()
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """
+        Lit une réponse Overpass depuis le cache disque si elle n'a pas expiré
+        
+        Args:
+            key: Hash SHA-256 de la requête
+            
+        Returns:
+            Optional[Dict]: Données OSM, None si absentes, expirées ou illisibles
+        """
+        cache_config = OSMConfig.CACHE_CONFIG
+        if not cache_config['enabled']:
+            return None
+        
+        cache_file = cache_config['directory'] / f"{key}.json.gz"
+        
+        try:
+            if time.time() - cache_file.stat().st_mtime > cache_config['ttl_seconds']:
+                return None
+            
+            result = _json_loads(gzip.decompress(cache_file.read_bytes()))
+            logger.info(f"💾 Réponse Overpass lue depuis le cache: {cache_file.name}")
+            return result
+            
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Cache Overpass illisible ({cache_file.name}): {e}")
+            return None
+    
+    def _cache_put(self, key: str, content: bytes):
+        """
+        Enregistre une réponse Overpass brute (compressée gzip) dans le cache disque
+        
+        Args:
+            key: Hash SHA-256 de la requête
+            content: Corps de la réponse HTTP
+        """
+        cache_config = OSMConfig.CACHE_CONFIG
+        if not cache_config['enabled']:
+            return
+        
+        cache_dir = cache_config['directory']
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Écriture atomique pour ne jamais lire un fichier partiel
+            tmp_file = cache_dir / f"{key}.json.gz.tmp"
+            tmp_file.write_bytes(gzip.compress(content))
+            tmp_file.replace(cache_dir / f"{key}.json.gz")
+        except OSError as e:
+            logger.warning(f"⚠️ Impossible d'écrire le cache Overpass: {e}")
+    
+    def _process_enhanced_buildings_data(self, elements: Iterable[Dict], zone_name: str,
+                                         keep_geometry: bool = True) -> List[Dict]:
         """
         Traite les éléments OSM avec extraction géométrique complète et métadonnées étages
         
+        Les éléments sont d'abord filtrés (type, tag building), puis la géométrie
+        de tous les candidats est calculée en un seul lot NumPy avant l'assemblage
+        des bâtiments.
+        
+        Sans keep_geometry, les clés 'geometry' et 'tags' sont omises: surfaces,
+        périmètres et métadonnées dérivées restent disponibles, pour une empreinte
+        mémoire bien plus faible sur les grandes zones.
+        
         Args:
-            elements: Éléments OSM bruts
+            elements: Éléments OSM bruts (liste ou itérateur, parcouru une seule fois)
             zone_name: Nom de la zone
+            keep_geometry: Conserver les polygones et tags bruts dans chaque bâtiment
             
         Returns:
             List[Dict]: Liste des bâtiments enrichis
         """
         buildings = []
-        processed_count = 0
+        candidates = []
         skipped_count = 0
+        elements_count = 0
         
-        logger.info(f"🔄 Traitement amélioré de {len(elements):,} éléments OSM")
-        
+        # Filtrage des éléments qui sont bien des bâtiments (way ou relation)
         for element in elements:
-            processed_count += 1
-            
-            # Affichage du progrès pour grandes collections
-            if processed_count % 5000 == 0:
-                logger.info(f"🔄 Progrès: {processed_count:,}/{len(elements):,} éléments traités")
-            
+            elements_count += 1
             try:
-                # Vérifier le type d'élément (way ou relation)
-                element_type = element.get('type')
-                if element_type not in ['way', 'relation']:
+                if element.get('type') not in _BUILDING_ELEMENT_TYPES:
                     skipped_count += 1
                     continue
                 
-                tags = element.get('tags', {})
-                building_tag = tags.get('building')
-                
-                # Vérifier que c'est bien un bâtiment
-                if not building_tag or building_tag in ['no', 'false']:
+                building_tag = (element.get('tags') or {}).get('building')
+                if not building_tag or building_tag in _NON_BUILDING_TAGS:
                     skipped_count += 1
                     continue
                 
-                # Extraction de la géométrie améliorée
-                geometry_data = self._extract_enhanced_geometry(element)
+                candidates.append(element)
                 
+            except Exception as e:
+                logger.debug("Erreur filtrage élément: %s", e)
+                skipped_count += 1
+        
+        logger.info(f"🔄 Traitement amélioré de {elements_count:,} éléments OSM")
+        
+        # Extraction géométrique vectorisée de tous les candidats
+        geometries = self._extract_enhanced_geometry_batch(candidates)
+        
+        for processed_count, (element, geometry_data) in enumerate(zip(candidates, geometries), 1):
+            
+            # Affichage du progrès pour grandes collections (formatage différé
+            # dans la boucle, seulement si le niveau est actif)
+            if processed_count % 5000 == 0 and logger.isEnabledFor(logging.INFO):
+                logger.info("🔄 Progrès: %s/%s bâtiments traités",
+                            f"{processed_count:,}", f"{len(candidates):,}")
+            
+            try:
                 if not geometry_data['valid']:
                     skipped_count += 1
                     continue
                 
+                element_type = element['type']
+                tags = element['tags']
+                building_tag = tags['building']
+                
                 # Extraction métadonnées d'étages améliorée
                 floors_data = self._extract_enhanced_floors_metadata(tags)
                 
                 # Déterminer le type de bâtiment amélioré
                 building_type = self._determine_enhanced_building_type(building_tag, tags)
                 
-                # Calcul surface précise du polygone
-                precise_surface = self._calculate_precise_polygon_area(geometry_data['coordinates'])
+                # Surface précise du polygone (calculée dans le lot géométrique)
+                precise_surface = geometry_data['area_m2']
                 
                 # Création de l'objet bâtiment enrichi
                 building = {
@@ -350,14 +828,17 @@ out geom tags;"""
                     
                     # VALIDATION
                     'validation_score': self._calculate_building_validation_score(
-                        geometry_data, floors_data, tags
+                        geometry_data, floors_data, tags, precise_surface
                     )
                 }
                 
+                if not keep_geometry:
+                    del building['geometry'], building['tags']
+                
                 buildings.append(building)
                 
             except Exception as e:
-                logger.debug(f"Erreur traitement élément {processed_count}: {e}")
+                logger.debug("Erreur traitement élément %d: %s", processed_count, e)
                 skipped_count += 1
                 continue
         
@@ -365,64 +846,125 @@ out geom tags;"""
         
         return buildings
     
-    def _extract_enhanced_geometry(self, element: Dict) -> Dict:
+    def _extract_enhanced_geometry_batch(self, elements: List[Dict]) -> List[Dict]:
         """
-        Extrait la géométrie complète d'un élément OSM
+        Extrait la géométrie complète d'une liste d'éléments OSM en un seul lot
+        
+        Tous les points sont aplatis dans deux tableaux NumPy (lats, lons) indexés
+        par polygone; centroïdes, surfaces (Shoelace), périmètres (haversine) et
+        complexités sont calculés par réductions vectorisées.
         
         Args:
-            element: Élément OSM
+            elements: Éléments OSM (way ou relation)
             
         Returns:
-            Dict: Données géométriques complètes
+            List[Dict]: Données géométriques, dans l'ordre des éléments
         """
-        try:
-            geometry = element.get('geometry', [])
-            
-            if not geometry or len(geometry) < 3:
-                return {'valid': False, 'error': 'Géométrie insuffisante'}
-            
-            # Extraction des coordonnées
-            coordinates = []
-            lats = []
-            lons = []
-            
+        n = len(elements)
+        if n == 0:
+            return []
+        
+        geometries = [element.get('geometry') or [] for element in elements]
+        counts = np.fromiter((len(g) for g in geometries), dtype=np.int64, count=n)
+        
+        # Aplatissement des coordonnées (NaN pour les points mal formés)
+        lat_values = []
+        lon_values = []
+        for geometry in geometries:
             for point in geometry:
-                if isinstance(point, dict) and 'lat' in point and 'lon' in point:
-                    lat = float(point['lat'])
-                    lon = float(point['lon'])
-                    
-                    # Validation coordonnées Malaysia
-                    if 0.5 <= lat <= 7.5 and 99.0 <= lon <= 120.0:
-                        coordinates.append({'lat': lat, 'lon': lon})
-                        lats.append(lat)
-                        lons.append(lon)
-            
-            if len(coordinates) < 3:
-                return {'valid': False, 'error': 'Moins de 3 points valides'}
-            
-            # Calcul du centroïde
-            centroid_lat = sum(lats) / len(lats)
-            centroid_lon = sum(lons) / len(lons)
+                if isinstance(point, dict):
+                    lat_values.append(point.get('lat'))
+                    lon_values.append(point.get('lon'))
+                else:
+                    lat_values.append(None)
+                    lon_values.append(None)
+        
+        lats = _coordinates_array(lat_values)
+        lons = _coordinates_array(lon_values)
+        polygon_ids = np.repeat(np.arange(n), counts)
+        
+        # Validation coordonnées Malaysia (les NaN sont exclus)
+        south, west, north, east = _MALAYSIA_BBOX
+        inside = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+        lats = lats[inside]
+        lons = lons[inside]
+        polygon_ids = polygon_ids[inside]
+        
+        valid_counts = np.bincount(polygon_ids, minlength=n)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(valid_counts, out=offsets[1:])
+        safe_counts = np.maximum(valid_counts, 1)
+        
+        # Calcul du centroïde
+        centroid_lats = np.bincount(polygon_ids, weights=lats, minlength=n) / safe_counts
+        centroid_lons = np.bincount(polygon_ids, weights=lons, minlength=n) / safe_counts
+        
+        # Indice du point suivant, en refermant chaque polygone sur son premier point
+        next_index = np.arange(1, lats.size + 1)
+        non_empty = valid_counts > 0
+        next_index[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+        next_lats = lats[next_index]
+        next_lons = lons[next_index]
+        
+        # Algorithme de Shoelace sur (x=lon, y=lat), converti en m² par
+        # projection équirectangulaire à la latitude moyenne du polygone
+        cross = lons * next_lats - next_lons * lats
+        area_deg = np.abs(np.bincount(polygon_ids, weights=cross, minlength=n)) / 2.0
+        meters_per_degree_lat = _METERS_PER_DEGREE
+        meters_per_degree_lon = _METERS_PER_DEGREE * np.cos(np.radians(centroid_lats))
+        areas_m2 = np.clip(area_deg * meters_per_degree_lat * meters_per_degree_lon, 10.0, 100000)
+        
+        # Périmètre (formule haversine)
+        lat1 = np.radians(lats)
+        lat2 = np.radians(next_lats)
+        dlat = lat2 - lat1
+        dlon = np.radians(next_lons) - np.radians(lons)
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+        edges_m = 6371000 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        perimeters_m = np.bincount(polygon_ids, weights=edges_m, minlength=n)
+        
+        # Complexité de forme basée sur le cercle équivalent
+        circle_perimeters = 2 * np.sqrt(np.pi * areas_m2)
+        complexities = np.where(
+            perimeters_m > 0,
+            np.clip(perimeters_m / circle_perimeters, 1.0, 5.0),
+            1.0
+        )
+        
+        results = []
+        for k in range(n):
+            if counts[k] < 3:
+                results.append({'valid': False, 'error': 'Géométrie insuffisante'})
+                continue
             
-            # Calcul du périmètre approximatif
-            perimeter_m = self._calculate_polygon_perimeter(coordinates)
+            points_count = int(valid_counts[k])
+            if points_count < 3:
+                results.append({'valid': False, 'error': 'Moins de 3 points valides'})
+                continue
             
-            # Calcul de la complexité de forme
-            shape_complexity = self._calculate_shape_complexity(coordinates)
+            start, end = offsets[k], offsets[k + 1]
+            if points_count == counts[k]:
+                # Tous les points sont valides: on partage la liste source
+                # au lieu d'en dupliquer chaque point
+                geometry_points = geometries[k]
+            else:
+                geometry_points = [
+                    {'lat': lat, 'lon': lon}
+                    for lat, lon in zip(lats[start:end].tolist(), lons[start:end].tolist())
+                ]
             
-            return {
+            results.append({
                 'valid': True,
-                'geometry_points': coordinates,
-                'coordinates': [(lat, lon) for lat, lon in zip(lats, lons)],
-                'centroid_lat': centroid_lat,
-                'centroid_lon': centroid_lon,
-                'points_count': len(coordinates),
-                'perimeter_m': perimeter_m,
-                'shape_complexity': shape_complexity
-            }
-            
-        except Exception as e:
-            return {'valid': False, 'error': str(e)}
+                'geometry_points': geometry_points,
+                'centroid_lat': float(centroid_lats[k]),
+                'centroid_lon': float(centroid_lons[k]),
+                'points_count': points_count,
+                'area_m2': float(areas_m2[k]),
+                'perimeter_m': float(perimeters_m[k]),
+                'shape_complexity': float(complexities[k])
+            })
+        
+        return results
     
     def _extract_enhanced_floors_metadata(self, tags: Dict) -> Dict:
         """
@@ -497,91 +1039,28 @@ out geom tags;"""
         Returns:
             str: Type de bâtiment normalisé
         """
-        # Mapping détaillé par tag building
-        building_type_mapping = {
-            # Résidentiel
-            'house': 'residential',
-            'detached': 'residential', 
-            'semi_detached': 'residential',
-            'terrace': 'residential',
-            'apartments': 'residential',
-            'residential': 'residential',
-            'dormitory': 'residential',
-            'bungalow': 'residential',
-            
-            # Commercial
-            'retail': 'commercial',
-            'shop': 'commercial',
-            'commercial': 'commercial',
-            'supermarket': 'commercial',
-            'mall': 'commercial',
-            'kiosk': 'commercial',
-            
-            # Bureau
-            'office': 'office',
-            'government': 'office',
-            'civic': 'office',
-            
-            # Industriel
-            'industrial': 'industrial',
-            'warehouse': 'industrial',
-            'factory': 'industrial',
-            'manufacture': 'industrial',
-            
-            # Éducation
-            'school': 'school',
-            'university': 'school',
-            'college': 'school',
-            'kindergarten': 'school',
-            
-            # Santé
-            'hospital': 'hospital',
-            'clinic': 'hospital',
-            'healthcare': 'hospital',
-            
-            # Autres
-            'hotel': 'commercial',
-            'restaurant': 'commercial',
-            'church': 'office',
-            'mosque': 'office',
-            'temple': 'office'
-        }
-        
         # Type direct depuis building tag
-        if building_tag in building_type_mapping:
-            return building_type_mapping[building_tag]
+        building_type = _BUILDING_TYPE_MAPPING.get(building_tag)
+        if building_type:
+            return building_type
         
         # Analyse des autres tags pour building=yes
         if building_tag == 'yes':
             # Analyse amenity
-            amenity = tags.get('amenity', '')
-            if amenity in ['school', 'university', 'college', 'kindergarten']:
-                return 'school'
-            elif amenity in ['hospital', 'clinic', 'doctors']:
-                return 'hospital'
-            elif amenity in ['restaurant', 'cafe', 'fast_food', 'bar', 'pub']:
-                return 'commercial'
-            elif amenity in ['bank', 'post_office', 'police', 'fire_station']:
-                return 'office'
+            building_type = _AMENITY_TYPE_MAPPING.get(tags.get('amenity'))
+            if building_type:
+                return building_type
             
-            # Analyse shop
-            shop = tags.get('shop', '')
-            if shop:
+            # Analyse shop / office
+            if tags.get('shop'):
                 return 'commercial'
-            
-            # Analyse office
-            office = tags.get('office', '')
-            if office:
+            if tags.get('office'):
                 return 'office'
             
             # Analyse landuse
-            landuse = tags.get('landuse', '')
-            if landuse == 'residential':
-                return 'residential'
-            elif landuse == 'industrial':
-                return 'industrial'
-            elif landuse == 'commercial':
-                return 'commercial'
+            building_type = _LANDUSE_TYPE_MAPPING.get(tags.get('landuse'))
+            if building_type:
+                return building_type
         
         # Par défaut
         return 'residential'
@@ -600,21 +1079,21 @@ out geom tags;"""
             return 100.0
         
         try:
-            # Algorithme de Shoelace
+            # Algorithme de Shoelace sur (x=lon, y=lat)
             area_deg = 0.0
             n = len(coordinates)
             
             for i in range(n):
                 j = (i + 1) % n
-                area_deg += coordinates[i][0] * coordinates[j][1]
-                area_deg -= coordinates[j][0] * coordinates[i][1]
+                area_deg += coordinates[i][1] * coordinates[j][0]
+                area_deg -= coordinates[j][1] * coordinates[i][0]
             
             area_deg = abs(area_deg) / 2.0
             
-            # Conversion en m² selon la latitude
+            # Conversion en m² selon la latitude moyenne
             lat_center = sum(coord[0] for coord in coordinates) / len(coordinates)
-            meters_per_degree_lat = 111000
-            meters_per_degree_lon = 111000 * math.cos(math.radians(lat_center))
+            meters_per_degree_lat = _METERS_PER_DEGREE
+            meters_per_degree_lon = _METERS_PER_DEGREE * math.cos(math.radians(lat_center))
             
             area_m2 = area_deg * meters_per_degree_lat * meters_per_degree_lon
             
@@ -624,79 +1103,6 @@ out geom tags;"""
         except Exception:
             return 100.0
     
-    def _calculate_polygon_perimeter(self, coordinates: List[Dict]) -> float:
-        """
-        Calcule le périmètre d'un polygone en mètres
-        
-        Args:
-            coordinates: Liste des points {'lat': float, 'lon': float}
-            
-        Returns:
-            float: Périmètre en mètres
-        """
-        if not coordinates or len(coordinates) < 2:
-            return 0.0
-        
-        try:
-            perimeter = 0.0
-            
-            for i in range(len(coordinates)):
-                j = (i + 1) % len(coordinates)
-                p1 = (coordinates[i]['lat'], coordinates[i]['lon'])
-                p2 = (coordinates[j]['lat'], coordinates[j]['lon'])
-                perimeter += self._distance_between_points(p1, p2)
-            
-            return perimeter
-            
-        except Exception:
-            return 0.0
-    
-    def _distance_between_points(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-        """Calcule la distance entre deux points en mètres (formule haversine)"""
-        lat1, lon1 = math.radians(p1[0]), math.radians(p1[1])
-        lat2, lon2 = math.radians(p2[0]), math.radians(p2[1])
-        
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2)
-        
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        return 6371000 * c  # Rayon terre en mètres
-    
-    def _calculate_shape_complexity(self, coordinates: List[Dict]) -> float:
-        """
-        Calcule un indice de complexité de forme (1.0 = cercle parfait, >1.0 = plus complexe)
-        
-        Args:
-            coordinates: Points du polygone
-            
-        Returns:
-            float: Indice de complexité
-        """
-        if not coordinates or len(coordinates) < 3:
-            return 1.0
-        
-        try:
-            # Calcul périmètre et aire
-            perimeter = self._calculate_polygon_perimeter(coordinates)
-            
-            coord_tuples = [(c['lat'], c['lon']) for c in coordinates]
-            area_m2 = self._calculate_precise_polygon_area(coord_tuples)
-            
-            if area_m2 <= 0 or perimeter <= 0:
-                return 1.0
-            
-            # Indice de compacité basé sur le cercle équivalent
-            circle_perimeter = 2 * math.sqrt(math.pi * area_m2)
-            complexity = perimeter / circle_perimeter
-            
-            return max(1.0, min(complexity, 5.0))
-            
-        except Exception:
-            return 1.0
-    
     def _extract_building_subtype(self, tags: Dict) -> Optional[str]:
         """Extrait le sous-type de bâtiment depuis les tags"""
         subtypes = [
@@ -740,15 +1146,9 @@ out geom tags;"""
         
         for year_value in year_sources:
             if year_value:
-                try:
-                    # Extraction de l'année depuis différents formats
-                    year_str = str(year_value)
-                    if len(year_str) >= 4:
-                        year = int(year_str[:4])
-                        if 1800 <= year <= 2030:
-                            return year
-                except (ValueError, TypeError):
-                    continue
+                year = parse_construction_year(year_value)
+                if year is not None:
+                    return year
         
         return None
     
@@ -786,7 +1186,8 @@ out geom tags;"""
         self, 
         geometry_data: Dict, 
         floors_data: Dict, 
-        tags: Dict
+        tags: Dict,
+        area_m2: Optional[float] = None
     ) -> float:
         """
         Calcule un score de validation de 0 à 1 pour le bâtiment
@@ -795,58 +1196,59 @@ out geom tags;"""
             geometry_data: Données géométriques
             floors_data: Données d'étages
             tags: Tags OSM
+            area_m2: Surface déjà calculée (évite un second Shoelace)
             
         Returns:
             float: Score de validation (0-1)
         """
-        score = 0.0
-        max_score = 7.0
+        score = 0
+        max_score = 7
         
         # Géométrie valide (+1)
         if geometry_data.get('valid', False):
-            score += 1.0
+            score += 1
         
         # Nombre suffisant de points (+1)
         if geometry_data.get('points_count', 0) >= 4:
-            score += 1.0
+            score += 1
         
         # Données d'étages de bonne qualité (+1)
         if floors_data.get('confidence') in ['high', 'medium']:
-            score += 1.0
+            score += 1
         
         # Tag building spécifique (+1)
         building_tag = tags.get('building', '')
         if building_tag and building_tag != 'yes':
-            score += 1.0
+            score += 1
         
         # Métadonnées enrichies (+1)
         if any(tags.get(key) for key in ['amenity', 'shop', 'office', 'building:use']):
-            score += 1.0
+            score += 1
         
         # Données de construction (+1)
         if any(tags.get(key) for key in ['building:material', 'start_date', 'building:levels']):
-            score += 1.0
+            score += 1
         
         # Surface réaliste (+1)
-        area = self._calculate_precise_polygon_area(geometry_data.get('coordinates', []))
-        if 20 <= area <= 50000:
-            score += 1.0
+        if area_m2 is None:
+            area_m2 = self._calculate_precise_polygon_area(geometry_data.get('coordinates', []))
+        if 20 <= area_m2 <= 50000:
+            score += 1
         
         return min(1.0, score / max_score)
     
-    def _calculate_processing_statistics(self, buildings: List[Dict], elements: List[Dict]) -> Dict:
+    def _calculate_processing_statistics(self, buildings: List[Dict], total_elements: int) -> Dict:
         """
         Calcule les statistiques de traitement
         
         Args:
             buildings: Bâtiments traités
-            elements: Éléments OSM bruts
+            total_elements: Nombre d'éléments OSM bruts reçus
             
         Returns:
             Dict: Statistiques de traitement
         """
         total_buildings = len(buildings)
-        total_elements = len(elements)
         
         if total_buildings == 0:
             return {
@@ -856,22 +1258,27 @@ out geom tags;"""
                 'average_validation_score': 0.0
             }
         
-        # Comptages
-        with_geometry = sum(1 for b in buildings if b.get('has_precise_geometry', False))
-        with_floors = sum(1 for b in buildings if b.get('floors_count', 1) > 1)
-        
-        # Scores de validation
-        validation_scores = [b.get('validation_score', 0) for b in buildings]
-        avg_validation = sum(validation_scores) / len(validation_scores)
-        
-        # Répartition par type
+        # Comptages en une seule passe
+        with_geometry = 0
+        with_floors = 0
+        validation_total = 0.0
+        total_area = 0.0
         type_distribution = {}
+        
         for building in buildings:
-            btype = building.get('building_type', 'unknown')
+            g = building.get
+            if g('has_precise_geometry', False):
+                with_geometry += 1
+            if g('floors_count', 1) > 1:
+                with_floors += 1
+            validation_total += g('validation_score', 0)
+            total_area += g('surface_area_m2', 0)
+            
+            # Répartition par type
+            btype = g('building_type', 'unknown')
             type_distribution[btype] = type_distribution.get(btype, 0) + 1
         
-        # Surface totale
-        total_area = sum(b.get('surface_area_m2', 0) for b in buildings)
+        avg_validation = validation_total / total_buildings
         
         return {
             'processing_rate': round(total_buildings / total_elements, 3),
@@ -885,16 +1292,43 @@ out geom tags;"""
             'average_surface_area_m2': round(total_area / total_buildings, 1)
         }
     
-    # Méthode alias pour compatibilité
-    def fetch_buildings_from_relation(self, zone_name: str) -> Dict:
-        """Alias pour compatibilité avec l'ancien code"""
-        return self.fetch_buildings_administrative(zone_name)
+    # Méthode alias pour compatibilité avec l'ancien code
+    fetch_buildings_from_relation = fetch_buildings_administrative
 
 
 # ==============================================================================
 # FONCTIONS UTILITAIRES GÉOMÉTRIQUES
 # ==============================================================================
 
+def parse_construction_year(value) -> Optional[int]:
+    """
+    Convertit une date OSM ('1998', '2005-03-01', ...) en année entière
+    
+    Args:
+        value: Valeur brute (str ou int)
+        
+    Returns:
+        Optional[int]: Année entre 1800 et 2030, None si non exploitable
+    """
+    try:
+        # Extraction de l'année depuis différents formats
+        year_str = str(value)
+        if len(year_str) >= 4:
+            year = int(year_str[:4])
+            if 1800 <= year <= 2030:
+                return year
+    except (ValueError, TypeError):
+        pass
+    
+    return None
+
+
+# Qualité géométrique indexée par min(nombre de points, 10)
+_GEOM_QUALITY_LUT = ('poor',) * 4 + ('fair',) * 2 + ('good',) * 4 + ('excellent',)
+
+# Qualité des métadonnées indexée par int(validation_score * 10), borné à 10
+_METADATA_QUALITY_LUT = ('poor',) * 4 + ('fair',) * 2 + ('good',) * 2 + ('excellent',) * 3
+
 def validate_enhanced_building_geometry(building: Dict) -> Dict:
     """
     Valide la géométrie améliorée d'un bâtiment
@@ -924,14 +1358,8 @@ def validate_enhanced_building_geometry(building: Dict) -> Dict:
     else:
         # Qualité géométrique
         points_count = len(geometry)
-        if points_count >= 10:
-            validation_result['geometry_quality'] = 'excellent'
-        elif points_count >= 6:
-            validation_result['geometry_quality'] = 'good'
-        elif points_count >= 4:
-            validation_result['geometry_quality'] = 'fair'
-        else:
-            validation_result['geometry_quality'] = 'poor'
+        validation_result['geometry_quality'] = _GEOM_QUALITY_LUT[min(points_count, 10)]
+        if points_count < 4:
             validation_result['warnings'].append('Peu de points géométriques')
     
     # Validation surface
@@ -952,14 +1380,8 @@ def validate_enhanced_building_geometry(building: Dict) -> Dict:
     
     # Qualité métadonnées
     metadata_score = building.get('validation_score', 0)
-    if metadata_score >= 0.8:
-        validation_result['metadata_quality'] = 'excellent'
-    elif metadata_score >= 0.6:
-        validation_result['metadata_quality'] = 'good'
-    elif metadata_score >= 0.4:
-        validation_result['metadata_quality'] = 'fair'
-    else:
-        validation_result['metadata_quality'] = 'poor'
+    metadata_index = int(metadata_score * 10) if metadata_score > 0 else 0
+    validation_result['metadata_quality'] = _METADATA_QUALITY_LUT[min(metadata_index, 10)]
     
     # Validation finale
     if validation_result['errors']:
@@ -986,36 +1408,88 @@ def calculate_geometry_statistics(buildings: List[Dict]) -> Dict:
     with_precise_geometry = 0
     total_surface = 0
     total_perimeter = 0
-    surfaces = []
-    perimeters = []
-    complexities = []
-    floors_list = []
+    surfaces = []  # Conservée pour la médiane
+    perimeter_count = 0
+    min_perimeter = math.inf
+    max_perimeter = -math.inf
+    total_complexity = 0.0
+    min_complexity = math.inf
+    max_complexity = -math.inf
+    total_floors = 0
+    min_floors = math.inf
+    max_floors = -math.inf
+    simple_buildings = 0
+    complex_buildings = 0
+    single_story = 0
+    multi_story = 0
+    high_rise = 0
     
-    # Analyse par bâtiment
+    # Analyse par bâtiment (min/max/sommes tenus au fil de l'eau)
     for building in buildings:
+        g = building.get
+        
         # Géométrie précise
-        if building.get('has_precise_geometry', False):
+        if g('has_precise_geometry', False):
             with_precise_geometry += 1
         
         # Surface
-        surface = building.get('surface_area_m2', 0)
+        surface = g('surface_area_m2', 0)
         if surface > 0:
             total_surface += surface
             surfaces.append(surface)
         
         # Périmètre
-        perimeter = building.get('polygon_perimeter_m', 0)
+        perimeter = g('polygon_perimeter_m', 0)
         if perimeter > 0:
             total_perimeter += perimeter
-            perimeters.append(perimeter)
+            perimeter_count += 1
+            if perimeter < min_perimeter:
+                min_perimeter = perimeter
+            if perimeter > max_perimeter:
+                max_perimeter = perimeter
         
         # Complexité
-        complexity = building.get('shape_complexity', 1.0)
-        complexities.append(complexity)
+        complexity = g('shape_complexity', 1.0)
+        total_complexity += complexity
+        if complexity < min_complexity:
+            min_complexity = complexity
+        if complexity > max_complexity:
+            max_complexity = complexity
+        if complexity <= 1.2:
+            simple_buildings += 1
+        elif complexity >= 2.0:
+            complex_buildings += 1
         
         # Étages
-        floors = building.get('floors_count', 1)
-        floors_list.append(floors)
+        floors = g('floors_count', 1)
+        total_floors += floors
+        if floors < min_floors:
+            min_floors = floors
+        if floors > max_floors:
+            max_floors = floors
+        if floors == 1:
+            single_story += 1
+        elif floors > 1:
+            multi_story += 1
+            if floors >= 10:
+                high_rise += 1
+    
+    # Agrégats calculés une seule fois
+    surface_count = len(surfaces)
+    if surface_count:
+        average_surface = round(total_surface / surface_count, 1)
+        min_surface = round(min(surfaces), 1)
+        max_surface = round(max(surfaces), 1)
+        median_surface = round(sorted(surfaces)[surface_count // 2], 1)
+    else:
+        average_surface = min_surface = max_surface = median_surface = 0
+    
+    if perimeter_count:
+        average_perimeter = round(total_perimeter / perimeter_count, 1)
+        min_perimeter = round(min_perimeter, 1)
+        max_perimeter = round(max_perimeter, 1)
+    else:
+        average_perimeter = min_perimeter = max_perimeter = 0
     
     # Calculs statistiques
     geometry_stats = {
@@ -1028,38 +1502,38 @@ def calculate_geometry_statistics(buildings: List[Dict]) -> Dict:
         },
         
         'surface_statistics': {
-            'count': len(surfaces),
+            'count': surface_count,
             'total_m2': round(total_surface, 1),
-            'average_m2': round(sum(surfaces) / len(surfaces), 1) if surfaces else 0,
-            'min_m2': round(min(surfaces), 1) if surfaces else 0,
-            'max_m2': round(max(surfaces), 1) if surfaces else 0,
-            'median_m2': round(sorted(surfaces)[len(surfaces)//2], 1) if surfaces else 0
+            'average_m2': average_surface,
+            'min_m2': min_surface,
+            'max_m2': max_surface,
+            'median_m2': median_surface
         },
         
         'perimeter_statistics': {
-            'count': len(perimeters),
+            'count': perimeter_count,
             'total_m': round(total_perimeter, 1),
-            'average_m': round(sum(perimeters) / len(perimeters), 1) if perimeters else 0,
-            'min_m': round(min(perimeters), 1) if perimeters else 0,
-            'max_m': round(max(perimeters), 1) if perimeters else 0
+            'average_m': average_perimeter,
+            'min_m': min_perimeter,
+            'max_m': max_perimeter
         },
         
         'complexity_statistics': {
-            'average_complexity': round(sum(complexities) / len(complexities), 3) if complexities else 1.0,
-            'min_complexity': round(min(complexities), 3) if complexities else 1.0,
-            'max_complexity': round(max(complexities), 3) if complexities else 1.0,
-            'simple_buildings': sum(1 for c in complexities if c <= 1.2),
-            'complex_buildings': sum(1 for c in complexities if c >= 2.0)
+            'average_complexity': round(total_complexity / total_buildings, 3),
+            'min_complexity': round(min_complexity, 3),
+            'max_complexity': round(max_complexity, 3),
+            'simple_buildings': simple_buildings,
+            'complex_buildings': complex_buildings
         },
         
         'floors_statistics': {
-            'total_floors': sum(floors_list),
-            'average_floors': round(sum(floors_list) / len(floors_list), 2),
-            'min_floors': min(floors_list),
-            'max_floors': max(floors_list),
-            'single_story': sum(1 for f in floors_list if f == 1),
-            'multi_story': sum(1 for f in floors_list if f > 1),
-            'high_rise': sum(1 for f in floors_list if f >= 10)
+            'total_floors': total_floors,
+            'average_floors': round(total_floors / total_buildings, 2),
+            'min_floors': min_floors,
+            'max_floors': max_floors,
+            'single_story': single_story,
+            'multi_story': multi_story,
+            'high_rise': high_rise
         }
     }
     
@@ -1082,42 +1556,73 @@ def export_enhanced_buildings_summary(buildings: List[Dict]) -> Dict:
     # Statistiques de base
     total_count = len(buildings)
     
-    # Répartition par type
-    type_distribution = {}
-    for building in buildings:
-        btype = building.get('building_type', 'unknown')
-        type_distribution[btype] = type_distribution.get(btype, 0) + 1
-    
     # Statistiques géométriques
     geometry_stats = calculate_geometry_statistics(buildings)
     
-    # Qualité des données
-    validation_scores = [b.get('validation_score', 0) for b in buildings]
-    avg_validation = sum(validation_scores) / len(validation_scores)
-    
-    high_quality = sum(1 for score in validation_scores if score >= 0.8)
-    medium_quality = sum(1 for score in validation_scores if 0.5 <= score < 0.8)
-    low_quality = sum(1 for score in validation_scores if score < 0.5)
-    
-    # Sources de données d'étages
+    # Passe unique: répartitions, qualité, étages, construction
+    type_distribution = {}
     floors_sources = {}
-    for building in buildings:
-        levels_source = building.get('levels_source', 'estimated')
-        floors_sources[levels_source] = floors_sources.get(levels_source, 0) + 1
-    
-    # Matériaux de construction
     materials = {}
+    years = []
+    validation_total = 0.0
+    high_quality = 0
+    medium_quality = 0
+    low_quality = 0
+    with_floors_data = 0
+    with_precise_floors = 0
+    precise_geometry_count = 0
+    shape_complexity_count = 0
+    construction_metadata_count = 0
+    osm_metadata_count = 0
+    
     for building in buildings:
-        material = building.get('construction_material')
+        g = building.get
+        
+        # Répartition par type
+        btype = g('building_type', 'unknown')
+        type_distribution[btype] = type_distribution.get(btype, 0) + 1
+        
+        # Qualité des données
+        score = g('validation_score', 0)
+        validation_total += score
+        if score >= 0.8:
+            high_quality += 1
+        elif score >= 0.5:
+            medium_quality += 1
+        else:
+            low_quality += 1
+        
+        # Sources de données d'étages
+        levels_source = g('levels_source', 'estimated')
+        floors_sources[levels_source] = floors_sources.get(levels_source, 0) + 1
+        if levels_source != 'estimated':
+            with_floors_data += 1
+        if g('levels_confidence') == 'high':
+            with_precise_floors += 1
+        
+        # Matériaux et années de construction
+        material = g('construction_material')
         if material:
             materials[material] = materials.get(material, 0) + 1
-    
-    # Années de construction
-    years = []
-    for building in buildings:
-        year = building.get('construction_year')
+        year = g('construction_year')
         if year:
-            years.append(year)
+            # Déjà entier à l'ingestion OSM; données externes converties ici
+            if not isinstance(year, int):
+                year = parse_construction_year(year)
+            if year:
+                years.append(year)
+        
+        # Fonctionnalités améliorées
+        if g('has_precise_geometry'):
+            precise_geometry_count += 1
+        if 'shape_complexity' in building:
+            shape_complexity_count += 1
+        if material or year:
+            construction_metadata_count += 1
+        if g('osm_timestamp'):
+            osm_metadata_count += 1
+    
+    avg_validation = validation_total / total_count
     
     # Temps de traitement
     processing_time = datetime.now().isoformat()
@@ -1134,7 +1639,7 @@ def export_enhanced_buildings_summary(buildings: List[Dict]) -> Dict:
         
         'distribution': {
             'by_type': type_distribution,
-            'most_common_type': max(type_distribution.items(), key=lambda x: x[1])[0] if type_distribution else 'unknown'
+            'most_common_type': max(type_distribution, key=type_distribution.get)
         },
         
         'geometry_analysis': geometry_stats,
@@ -1153,8 +1658,8 @@ def export_enhanced_buildings_summary(buildings: List[Dict]) -> Dict:
         
         'floors_analysis': {
             'sources_distribution': floors_sources,
-            'buildings_with_floors_data': sum(1 for b in buildings if b.get('levels_source') != 'estimated'),
-            'buildings_with_precise_floors': sum(1 for b in buildings if b.get('levels_confidence') == 'high')
+            'buildings_with_floors_data': with_floors_data,
+            'buildings_with_precise_floors': with_precise_floors
         },
         
         'construction_analysis': {
@@ -1169,10 +1674,10 @@ def export_enhanced_buildings_summary(buildings: List[Dict]) -> Dict:
         },
         
         'enhanced_features': {
-            'precise_geometry_count': sum(1 for b in buildings if b.get('has_precise_geometry')),
-            'shape_complexity_analyzed': sum(1 for b in buildings if 'shape_complexity' in b),
-            'construction_metadata_count': sum(1 for b in buildings if b.get('construction_material') or b.get('construction_year')),
-            'osm_metadata_preserved': sum(1 for b in buildings if b.get('osm_timestamp'))
+            'precise_geometry_count': precise_geometry_count,
+            'shape_complexity_analyzed': shape_complexity_count,
+            'construction_metadata_count': construction_metadata_count,
+            'osm_metadata_preserved': osm_metadata_count
         }
     }
     
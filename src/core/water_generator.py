@@ -11,16 +11,167 @@ pour une génération plus précise de la consommation d'eau.
 import time
 import logging
 import math
+from bisect import bisect_left
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
-from config import MalaysiaConfig
+from config import MalaysiaConfig, MathConstants
 from src.utils.helpers import generate_unique_id
 
 logger = logging.getLogger(__name__)
 
+# Surcoût d'eau par étage supplémentaire selon le type (0.08 par défaut)
+_WATER_FLOORS_EFFICIENCY_RATES = {
+    'residential': 0.1,   # Résidentiel: plus d'étages = plus de points d'eau
+    'office': 0.12,       # Bureau: systèmes plus efficaces mais plus de points d'eau
+    'commercial': 0.12,
+    'hospital': 0.15      # Hôpital: besoins très élevés par étage
+}
+
+# Sources du nombre d'étages, par ordre de priorité
+_FLOORS_KEYS = ('floors_count', 'floors', 'levels', 'building_levels')
+_FLOORS_TAG_KEYS = ('building:levels', 'levels')
+_EMPTY_TAGS = {}
+
+# Efficacité hydrique par type de bâtiment
+_WATER_TYPE_EFFICIENCY = {
+    'residential': 0.85,    # Usage varié, moins optimisé
+    'office': 0.90,        # Usage prévisible
+    'commercial': 0.80,    # Usage intensif
+    'industrial': 0.75,    # Besoins process
+    'hospital': 0.70,      # Besoins sanitaires stricts
+    'school': 0.85         # Usage modéré et prévisible
+}
+_DEFAULT_WATER_TYPE_EFFICIENCY = 0.80
+
+# Efficacité verticale par tranche d'étages: jusqu'à 2, 5, 10 étages, au-delà
+_VERTICAL_EFFICIENCY_FLOORS = (2, 5, 10)
+_VERTICAL_EFFICIENCIES = (1.0, 0.95, 0.90, 0.85)
+_VERTICAL_EFFICIENCIES_ARRAY = np.array(_VERTICAL_EFFICIENCIES)
+
+# Classes d'efficacité hydrique, de la meilleure à la moins bonne, et seuils
+# croissants d'efficacité globale (strictement au-dessus) de Médiocre à Excellent
+_WATER_EFFICIENCY_CLASSES = ('Excellent', 'Bon', 'Moyen', 'Médiocre')
+_WATER_EFFICIENCY_THRESHOLDS = (0.7, 0.8, 0.9)
+
+# Catégories de nombre d'étages de l'analyse des consommations
+_WATER_FLOORS_CATEGORIES = ('1', '2-3', '4-10', '10+')
+
+# Nombre de points (bâtiments × pas de temps) calculés par bloc de génération
+_WATER_KERNEL_CHUNK_POINTS = 1 << 20
+
+
+def _floors_distribution(values: List[int], probabilities: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Valeurs et fonction de répartition normalisée (comme np.random.choice)"""
+    cdf = np.cumsum(probabilities, dtype=np.float64)
+    cdf /= cdf[-1]
+    return np.array(values, dtype=np.int64), cdf
+
+
+# Distribution du nombre d'étages estimé par type quand il est inconnu (1 sinon)
+_OFFICE_FLOORS_DISTRIBUTION = _floors_distribution(
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    [0.3, 0.2, 0.15, 0.1, 0.08, 0.06, 0.04, 0.03, 0.02, 0.02]
+)
+_FLOORS_ESTIMATION = {
+    'residential': _floors_distribution([1, 2, 3], [0.6, 0.3, 0.1]),
+    'office': _OFFICE_FLOORS_DISTRIBUTION,
+    'commercial': _OFFICE_FLOORS_DISTRIBUTION,
+    'industrial': _floors_distribution([1, 2], [0.8, 0.2]),
+    'hospital': _floors_distribution([2, 3, 4, 5, 6], [0.1, 0.3, 0.3, 0.2, 0.1])
+}
+
+
+def _parse_floors_value(value) -> Optional[int]:
+    """
+    Convertit une valeur d'étages brute en entier plausible
+    
+    Args:
+        value: Valeur brute (int, float ou str), None si absente
+        
+    Returns:
+        Optional[int]: Nombre d'étages entre 1 et 200, None sinon
+    """
+    if value is None:
+        return None
+    try:
+        floors = int(float(value))
+    except (ValueError, TypeError):
+        return None
+    return floors if 1 <= floors <= 200 else None
+
+
+@dataclass
+class WaterBuildingColumns:
+    """
+    Bâtiments prétraités pour l'eau, stockés par colonnes
+    
+    L'élément i de chaque tableau décrit le bâtiment i; le type est encodé
+    par son indice dans type_names.
+    """
+    
+    unique_ids: List[str]
+    type_names: List[str]
+    type_codes: np.ndarray
+    surface_areas: np.ndarray
+    precise_surface_areas: np.ndarray
+    floors_counts: np.ndarray
+    pressure_needs: np.ndarray
+    distribution_complexities: np.ndarray
+    has_precise_geometry: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.unique_ids)
+
+
+def _polygon_ring_metrics(rings: List[Optional[List[Tuple[float, float]]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calcule aire, périmètre et latitude moyenne de chaque polygone en un seul lot
+    
+    Tous les points sont aplatis dans deux tableaux (lats, lons); chaque
+    polygone est refermé sur son premier point et les sommes par polygone
+    sont obtenues par np.bincount.
+    
+    Args:
+        rings: Coordonnées (lat, lon) de chaque polygone, None si absent
+        
+    Returns:
+        Tuple: (aires en degrés², périmètres en degrés, latitudes moyennes)
+    """
+    n = len(rings)
+    counts = np.fromiter((len(ring) if ring else 0 for ring in rings), dtype=np.int64, count=n)
+    
+    coordinates = np.array([point for ring in rings if ring for point in ring], dtype=np.float64).reshape(-1, 2)
+    lats = coordinates[:, 0]
+    lons = coordinates[:, 1]
+    polygon_ids = np.repeat(np.arange(n), counts)
+    
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    
+    # Indice du point suivant, en refermant chaque polygone sur son premier point
+    next_index = np.arange(1, lats.size + 1)
+    non_empty = counts > 0
+    next_index[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+    next_lats = lats[next_index]
+    next_lons = lons[next_index]
+    
+    # Algorithme de Shoelace
+    cross = lats * next_lons - next_lats * lons
+    areas_deg = np.abs(np.bincount(polygon_ids, weights=cross, minlength=n)) / 2.0
+    
+    # Périmètre dans l'espace des degrés
+    dx = next_lats - lats
+    dy = next_lons - lons
+    perimeters_deg = np.bincount(polygon_ids, weights=np.sqrt(dx * dx + dy * dy), minlength=n)
+    
+    lat_centers = np.bincount(polygon_ids, weights=lats, minlength=n) / np.maximum(counts, 1)
+    
+    return areas_deg, perimeters_deg, lat_centers
+
 
 class WaterGenerator:
     """Générateur de consommation d'eau amélioré avec géométrie précise"""
@@ -28,6 +179,20 @@ class WaterGenerator:
     def __init__(self):
         """Initialise le générateur d'eau amélioré"""
         self.generation_count = 0
+        
+        # Tables de facteurs (heure, jour, mois) calculées une fois par type;
+        # les types hors configuration sont ajoutés à la première utilisation
+        self._hourly_lut = {
+            building_type: np.array([self._get_water_hourly_factor(hour, building_type) for hour in range(24)])
+            for building_type in MalaysiaConfig.BUILDING_TYPES
+        }
+        self._daily_lut = {
+            building_type: np.array([self._get_water_daily_factor(day, building_type) for day in range(7)])
+            for building_type in MalaysiaConfig.BUILDING_TYPES
+        }
+        self._floors_lut = {}
+        self._seasonal_lut = np.array([self._get_water_seasonal_factor(month) for month in range(1, 13)])
+        
         logger.info("✅ WaterGenerator initialisé (polygone + étages)")
     
     def generate_water_consumption_timeseries(
@@ -57,36 +222,61 @@ class WaterGenerator:
             logger.info(f"Période: {start_date} → {end_date} ({frequency})")
             
             # Prétraitement des bâtiments (réutilise la logique du générateur électrique)
-            processed_buildings = self._preprocess_buildings_for_water(buildings)
+            columns = self._preprocess_buildings_for_water(buildings)
+            building_count = len(columns)
+            
+            # Consommation de base et capacité journalière de tous les bâtiments en une passe
+            base_consumptions, daily_capacities = self._calculate_enhanced_base_water_consumption(columns)
             
             # Création de l'index temporel
             date_range = pd.date_range(start=start_date, end=end_date, freq=frequency)
             logger.info(f"{len(date_range)} points temporels à générer")
             
-            # Génération des données
-            water_data = []
+            # Génération des données dans une colonne préallouée (un bloc
+            # contigu de len(date_range) points par bâtiment), initialisée
+            # avec la variation aléatoire de toute la génération en un tirage
+            points_per_building = len(date_range)
+            water_values = np.random.normal(1.0, 0.15, size=building_count * points_per_building)
             
-            for building in processed_buildings:
-                building_water = self._generate_enhanced_building_water_series(
-                    building, date_range, frequency
-                )
-                water_data.extend(building_water)
+            # Calendrier calculé une seule fois pour tous les bâtiments
+            hours = date_range.hour.to_numpy()
+            days = date_range.dayofweek.to_numpy()
+            months = date_range.month.to_numpy()
+            
+            self._generate_water_values(
+                columns, base_consumptions, hours, days, months,
+                water_values.reshape(building_count, points_per_building)
+            )
             
-            # Création du DataFrame
-            df = pd.DataFrame(water_data)
+            # Création du DataFrame en une fois (identifiants et fréquence catégoriels,
+            # y en float32 et horodatage à la seconde : précision largement suffisante
+            # face au bruit de ±15 % et aux arrondis à 4 décimales de l'export)
+            building_codes, building_ids = pd.factorize(
+                np.array(columns.unique_ids, dtype=object), sort=True
+            )
+            df = pd.DataFrame({
+                'unique_id': pd.Categorical.from_codes(
+                    np.repeat(building_codes, points_per_building), categories=building_ids
+                ),
+                'timestamp': np.tile(date_range.to_numpy().astype('datetime64[s]'), building_count),
+                'y': water_values.astype(np.float32),
+                'frequency': pd.Categorical.from_codes(
+                    np.zeros(len(water_values), dtype=np.int8), categories=[frequency]
+                )
+            })
             
             generation_time = time.time() - start_time
-            logger.info(f"✅ {len(water_data)} points eau générés en {generation_time:.1f}s")
+            logger.info(f"✅ {len(df)} points eau générés en {generation_time:.1f}s")
             
             # Statistiques géométriques eau
-            total_water_capacity = sum(self._calculate_building_water_capacity(b) for b in processed_buildings)
-            avg_floors = sum(b['floors_count'] for b in processed_buildings) / len(processed_buildings)
+            total_water_capacity = float(daily_capacities.sum())
+            avg_floors = int(columns.floors_counts.sum()) / building_count
             
             return {
                 'success': True,
                 'data': df,
                 'metadata': {
-                    'total_points': len(water_data),
+                    'total_points': len(df),
                     'buildings_count': len(buildings),
                     'time_range': f"{start_date} → {end_date}",
                     'frequency': frequency,
@@ -95,8 +285,8 @@ class WaterGenerator:
                     'water_statistics': {
                         'total_daily_capacity_liters': round(total_water_capacity, 1),
                         'average_floors': round(avg_floors, 1),
-                        'buildings_with_geometry': sum(1 for b in processed_buildings if b['has_precise_geometry']),
-                        'buildings_with_floor_data': sum(1 for b in processed_buildings if b['floors_count'] > 1)
+                        'buildings_with_geometry': int(columns.has_precise_geometry.sum()),
+                        'buildings_with_floor_data': int((columns.floors_counts > 1).sum())
                     }
                 }
             }
@@ -108,7 +298,7 @@ class WaterGenerator:
                 'error': str(e)
             }
     
-    def _preprocess_buildings_for_water(self, buildings: List[Dict]) -> List[Dict]:
+    def _preprocess_buildings_for_water(self, buildings: List[Dict]) -> WaterBuildingColumns:
         """
         Prétraite les bâtiments pour l'eau (simplifié par rapport à l'électricité)
         
@@ -116,12 +306,49 @@ class WaterGenerator:
             buildings: Liste des bâtiments bruts
             
         Returns:
-            List[Dict]: Bâtiments avec géométrie calculée pour l'eau
+            WaterBuildingColumns: Bâtiments avec géométrie calculée pour l'eau, par colonnes
         """
-        processed_buildings = []
+        unique_ids = []
+        type_codes = []
+        type_index = {}
+        surface_areas = []
+        precise_surface_areas = []
+        floors_counts = []
+        distribution_complexities = []
+        has_precise_geometry = []
+        estimated_types = {}
         
         logger.info("🔧 Prétraitement géométrique des bâtiments pour l'eau...")
         
+        # Aire, périmètre et centre de tous les polygones en un seul lot
+        rings = [self._parse_polygon_coordinates(building) for building in buildings]
+        areas_deg, perimeters_deg, lat_centers = _polygon_ring_metrics(rings)
+        areas_m2 = self._calculate_precise_areas_from_polygons(areas_deg, lat_centers).tolist()
+        
+        # Complexité de distribution: forme calculée sur les seuls points dict
+        # (lat/lon); les métriques ne sont recalculées que pour les polygones
+        # dont ces points diffèrent du polygone complet (points liste, mixtes)
+        shape_rings = [
+            self._parse_distribution_shape_ring(building, ring)
+            for ring, building in zip(rings, buildings)
+        ]
+        with_shape = np.array([shape_ring is not None for shape_ring in shape_rings], dtype=bool)
+        shape_areas_deg = areas_deg
+        shape_perimeters_deg = perimeters_deg
+        differing = [
+            i for i, (shape_ring, ring) in enumerate(zip(shape_rings, rings))
+            if shape_ring is not None and shape_ring is not ring
+        ]
+        if differing:
+            shape_areas_deg = areas_deg.copy()
+            shape_perimeters_deg = perimeters_deg.copy()
+            differing_areas, differing_perimeters, _ = _polygon_ring_metrics([shape_rings[i] for i in differing])
+            shape_areas_deg[differing] = differing_areas
+            shape_perimeters_deg[differing] = differing_perimeters
+        complexities = self._calculate_distribution_complexities(
+            shape_areas_deg, shape_perimeters_deg, with_shape
+        ).tolist()
+        
         for i, building in enumerate(buildings):
             try:
                 # Extraction des données de base
@@ -133,7 +360,8 @@ class WaterGenerator:
                 building_type = building.get('building_type', 'residential')
                 
                 # === CALCUL SURFACE PRÉCISE DEPUIS POLYGONE ===
-                precise_area, has_geometry = self._calculate_precise_area_from_polygon(building)
+                has_geometry = rings[i] is not None
+                precise_area = areas_m2[i] if has_geometry else 100.0
                 fallback_area = building.get('surface_area_m2', 100.0)
                 if fallback_area <= 0:
                     fallback_area = 100.0
@@ -141,67 +369,71 @@ class WaterGenerator:
                 final_surface = precise_area if has_geometry else fallback_area
                 
                 # === EXTRACTION NOMBRE D'ÉTAGES ===
+                # (estimation par type différée et tirée en lot après la boucle)
                 floors_count = self._extract_floors_count(building)
+                if floors_count is None:
+                    estimated_types[i] = building_type
+                    floors_count = 1
                 
                 # === CALCULS SPÉCIFIQUES À L'EAU ===
-                water_pressure_floors = self._calculate_water_pressure_needs(floors_count)
-                water_distribution_complexity = self._calculate_distribution_complexity(building, has_geometry)
-                
-                # Construction du bâtiment enrichi pour l'eau
-                enhanced_building = {
-                    'unique_id': building_id,
-                    'building_type': building_type,
-                    'latitude': building.get('latitude', 3.1390),
-                    'longitude': building.get('longitude', 101.6869),
-                    'surface_area_m2': final_surface,
-                    'precise_surface_area_m2': precise_area,
-                    'floors_count': floors_count,
-                    'zone_name': building.get('zone_name', 'unknown'),
-                    'source': building.get('source', 'osm'),
-                    'has_precise_geometry': has_geometry,
-                    # Spécifiques à l'eau
-                    'water_pressure_needs': water_pressure_floors,
-                    'distribution_complexity': water_distribution_complexity,
-                    'original_geometry': building.get('geometry', []),
-                    'osm_tags': building.get('tags', {}),
-                    'osm_id': building.get('osm_id')
-                }
-                
-                processed_buildings.append(enhanced_building)
+                water_distribution_complexity = complexities[i]
                 
             except Exception as e:
-                logger.warning(f"Erreur prétraitement bâtiment eau {i}: {e}")
+                logger.warning("Erreur prétraitement bâtiment eau %d: %s", i, e)
                 # Bâtiment de fallback pour l'eau
-                fallback_building = {
-                    'unique_id': f'water_fallback_{i}',
-                    'building_type': 'residential',
-                    'latitude': 3.1390,
-                    'longitude': 101.6869,
-                    'surface_area_m2': 100.0,
-                    'precise_surface_area_m2': 100.0,
-                    'floors_count': 1,
-                    'zone_name': 'unknown',
-                    'source': 'fallback',
-                    'has_precise_geometry': False,
-                    'water_pressure_needs': 1.0,
-                    'distribution_complexity': 1.0
-                }
-                processed_buildings.append(fallback_building)
+                building_id = f'water_fallback_{i}'
+                building_type = 'residential'
+                final_surface = 100.0
+                precise_area = 100.0
+                floors_count = 1
+                has_geometry = False
+                water_distribution_complexity = 1.0
+                estimated_types.pop(i, None)
+            
+            unique_ids.append(building_id)
+            type_codes.append(type_index.setdefault(building_type, len(type_index)))
+            surface_areas.append(final_surface)
+            precise_surface_areas.append(precise_area)
+            floors_counts.append(floors_count)
+            distribution_complexities.append(water_distribution_complexity)
+            has_precise_geometry.append(has_geometry)
         
-        logger.info(f"✅ Prétraitement eau terminé: {len(processed_buildings)} bâtiments")
+        floors_counts = np.array(floors_counts, dtype=np.int64)
+        if estimated_types:
+            estimated_indices = np.fromiter(estimated_types, dtype=np.int64, count=len(estimated_types))
+            floors_counts[estimated_indices] = self._estimate_floors_counts(list(estimated_types.values()))
+        pressure_needs = [self._calculate_water_pressure_needs(floors) for floors in floors_counts.tolist()]
         
-        return processed_buildings
+        logger.info(f"✅ Prétraitement eau terminé: {len(unique_ids)} bâtiments")
+        
+        return WaterBuildingColumns(
+            unique_ids=unique_ids,
+            type_names=list(type_index),
+            type_codes=np.array(type_codes, dtype=np.int16),
+            surface_areas=np.array(surface_areas, dtype=np.float64),
+            precise_surface_areas=np.array(precise_surface_areas, dtype=np.float64),
+            floors_counts=floors_counts,
+            pressure_needs=np.array(pressure_needs, dtype=np.float64),
+            distribution_complexities=np.array(distribution_complexities, dtype=np.float64),
+            has_precise_geometry=np.array(has_precise_geometry, dtype=bool)
+        )
     
-    def _calculate_precise_area_from_polygon(self, building: Dict) -> Tuple[float, bool]:
-        """
-        Calcule la surface précise depuis le polygone OSM (identique au générateur électricité)
+    def _parse_polygon_coordinates(self, building: Dict) -> Optional[List[Tuple[float, float]]]:
         """
-        geometry = building.get('geometry', [])
-        
-        if not geometry or not isinstance(geometry, list) or len(geometry) < 3:
-            return 100.0, False
+        Extrait les coordonnées (lat, lon) du polygone OSM d'un bâtiment
         
+        Args:
+            building: Données du bâtiment
+            
+        Returns:
+            Optional[List[Tuple[float, float]]]: Coordonnées, None si moins de 3 points exploitables
+        """
         try:
+            geometry = building.get('geometry', [])
+            
+            if not geometry or not isinstance(geometry, list) or len(geometry) < 3:
+                return None
+            
             coordinates = []
             for point in geometry:
                 if isinstance(point, dict) and 'lat' in point and 'lon' in point:
@@ -214,79 +446,131 @@ class WaterGenerator:
                     coordinates.append((lat, lon))
             
             if len(coordinates) < 3:
-                return 100.0, False
-            
-            # Algorithme de Shoelace
-            area_deg = self._shoelace_area(coordinates)
-            
-            # Conversion en m²
-            lat_center = sum(coord[0] for coord in coordinates) / len(coordinates)
-            meters_per_degree_lat = 111000
-            meters_per_degree_lon = 111000 * math.cos(math.radians(lat_center))
-            area_m2 = area_deg * meters_per_degree_lat * meters_per_degree_lon
+                return None
             
-            # Limites réalistes
-            if area_m2 < 10:
-                area_m2 = 50.0
-            elif area_m2 > 100000:
-                area_m2 = 100000.0
-            
-            return area_m2, True
+            return coordinates
             
         except Exception as e:
-            logger.debug(f"Erreur calcul surface polygone eau: {e}")
-            return 100.0, False
+            logger.debug("Erreur calcul surface polygone eau: %s", e)
+            return None
     
-    def _shoelace_area(self, coordinates: List[Tuple[float, float]]) -> float:
-        """Calcule l'aire avec la formule shoelace"""
-        n = len(coordinates)
-        area = 0.0
+    def _parse_distribution_shape_ring(
+        self,
+        building: Dict,
+        ring: Optional[List[Tuple[float, float]]]
+    ) -> Optional[List[Tuple[float, float]]]:
+        """
+        Points utilisés pour la forme de distribution d'eau d'un bâtiment
         
-        for i in range(n):
-            j = (i + 1) % n
-            area += coordinates[i][0] * coordinates[j][1]
-            area -= coordinates[j][0] * coordinates[i][1]
+        Seuls les points dict avec 'lat' et 'lon' numériques comptent (les
+        points liste ne participent qu'à la surface); il faut une géométrie
+        exploitable d'au moins 4 points et au moins 3 points dict.
+        
+        Args:
+            building: Données du bâtiment
+            ring: Polygone complet issu de _parse_polygon_coordinates
+            
+        Returns:
+            Optional[List[Tuple[float, float]]]: ring lui-même s'il n'a que des points
+                dict, les points dict sinon, None si la forme n'est pas calculable
+        """
+        geometry = building.get('geometry', [])
+        if ring is None or len(geometry) < 4:
+            return None
         
-        return abs(area) / 2.0
+        points = []
+        for point in geometry:
+            if isinstance(point, dict) and 'lat' in point and 'lon' in point:
+                lat = point['lat']
+                lon = point['lon']
+                if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+                    return None
+                points.append((lat, lon))
+        
+        if len(points) < 3:
+            return None
+        
+        return ring if len(points) == len(ring) else points
+    
+    def _calculate_precise_areas_from_polygons(self, areas_deg: np.ndarray, lat_centers: np.ndarray) -> np.ndarray:
+        """
+        Convertit les aires Shoelace des polygones (degrés²) en surfaces précises (m²)
+        
+        Args:
+            areas_deg: Aires des polygones en degrés²
+            lat_centers: Latitudes moyennes des polygones
+            
+        Returns:
+            np.ndarray: Surfaces en m²
+        """
+        # Même conversion que l'extraction OSM (surfaces cohérentes entre modules)
+        meters_per_degree_lat = MathConstants.METERS_PER_DEGREE_LAT
+        meters_per_degree_lon = MathConstants.METERS_PER_DEGREE_LAT * np.cos(np.radians(lat_centers))
+        areas_m2 = areas_deg * meters_per_degree_lat * meters_per_degree_lon
+        
+        # Limites réalistes
+        return np.where(areas_m2 < 10, 50.0, np.minimum(areas_m2, 100000.0))
     
-    def _extract_floors_count(self, building: Dict) -> int:
+    def _extract_floors_count(self, building: Dict) -> Optional[int]:
         """
         Extrait le nombre d'étages (identique au générateur électricité)
+        
+        Returns:
+            Optional[int]: Nombre d'étages connu, None s'il doit être estimé
         """
-        floors_sources = [
-            building.get('floors_count'),
-            building.get('floors'),
-            building.get('levels'),
-            building.get('building_levels'),
-            building.get('osm_tags', {}).get('building:levels'),
-            building.get('tags', {}).get('building:levels'),
-            building.get('osm_tags', {}).get('levels'),
-            building.get('tags', {}).get('levels')
-        ]
+        # Champs directs, puis tags OSM (osm_tags avant tags pour chaque clé);
+        # la recherche s'arrête à la première valeur exploitable
+        for key in _FLOORS_KEYS:
+            floors = _parse_floors_value(building.get(key))
+            if floors is not None:
+                return floors
         
-        for floors_value in floors_sources:
-            if floors_value is not None:
-                try:
-                    floors = int(float(floors_value))
-                    if 1 <= floors <= 200:
-                        return floors
-                except (ValueError, TypeError):
-                    continue
+        osm_tags = building.get('osm_tags', _EMPTY_TAGS)
+        tags = building.get('tags', _EMPTY_TAGS)
+        for key in _FLOORS_TAG_KEYS:
+            floors = _parse_floors_value(osm_tags.get(key))
+            if floors is None:
+                floors = _parse_floors_value(tags.get(key))
+            if floors is not None:
+                return floors
         
-        # Estimation basée sur le type
-        building_type = building.get('building_type', 'residential')
+        # Inconnu: estimation par type, faite en lot par _estimate_floors_counts
+        return None
+    
+    def _estimate_floors_counts(self, building_types: List[str]) -> np.ndarray:
+        """
+        Estime en lot le nombre d'étages de bâtiments sans donnée d'étages
         
-        if building_type == 'residential':
-            return np.random.choice([1, 2, 3], p=[0.6, 0.3, 0.1])
-        elif building_type in ['office', 'commercial']:
-            return np.random.choice([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 
-                                  p=[0.3, 0.2, 0.15, 0.1, 0.08, 0.06, 0.04, 0.03, 0.02, 0.02])
-        elif building_type == 'industrial':
-            return np.random.choice([1, 2], p=[0.8, 0.2])
-        elif building_type == 'hospital':
-            return np.random.choice([2, 3, 4, 5, 6], p=[0.1, 0.3, 0.3, 0.2, 0.1])
-        else:
-            return 1
+        Un seul tirage uniforme est fait pour tous les bâtiments à estimer, dans
+        leur ordre, puis chaque groupe de type le convertit avec sa fonction de
+        répartition: le résultat est identique à un np.random.choice par bâtiment.
+        
+        Args:
+            building_types: Type de chaque bâtiment à estimer
+            
+        Returns:
+            np.ndarray: Nombre d'étages estimé de chaque bâtiment
+        """
+        floors_counts = np.ones(len(building_types), dtype=np.int64)
+        
+        groups = {}
+        for i, building_type in enumerate(building_types):
+            if building_type in _FLOORS_ESTIMATION:
+                groups.setdefault(building_type, []).append(i)
+        if not groups:
+            return floors_counts
+        
+        # Les types sans distribution (étage unique) ne consomment pas de tirage
+        drawn = np.sort(np.concatenate([np.array(idx, dtype=np.int64) for idx in groups.values()]))
+        uniforms = np.empty(len(building_types))
+        uniforms[drawn] = np.random.random_sample(len(drawn))
+        
+        for building_type, idx in groups.items():
+            values, cdf = _FLOORS_ESTIMATION[building_type]
+            idx = np.array(idx, dtype=np.int64)
+            floors_counts[idx] = values[cdf.searchsorted(uniforms[idx], side='right')]
+        
+        return floors_counts
     
     def _calculate_water_pressure_needs(self, floors_count: int) -> float:
         """
@@ -313,213 +597,186 @@ class WaterGenerator:
         
         return pressure_factor
     
-    def _calculate_distribution_complexity(self, building: Dict, has_geometry: bool) -> float:
+    def _calculate_distribution_complexities(
+        self, 
+        areas_deg: np.ndarray, 
+        perimeters_deg: np.ndarray,
+        with_shape: np.ndarray
+    ) -> np.ndarray:
         """
-        Calcule la complexité de distribution d'eau selon la forme du bâtiment
+        Calcule la complexité de distribution d'eau selon la forme des bâtiments
         
         Args:
-            building: Données du bâtiment
-            has_geometry: Si la géométrie précise est disponible
+            areas_deg: Aires des polygones en degrés²
+            perimeters_deg: Périmètres des polygones en degrés
+            with_shape: Bâtiments dont la géométrie permet le calcul de forme
             
         Returns:
-            float: Facteur de complexité (1.0 = simple, >1.0 = plus complexe)
+            np.ndarray: Facteurs de complexité (1.0 = simple, >1.0 = plus complexe)
         """
-        if not has_geometry:
-            return 1.0
+        # Facteur de forme (bâtiments allongés = distribution plus complexe)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shape_factor = perimeters_deg / (2 * np.sqrt(np.pi * areas_deg))
         
-        geometry = building.get('geometry', [])
-        if len(geometry) < 4:
-            return 1.0
+        # Complexité distribution basée sur la forme
+        # Formes allongées nécessitent plus de tuyauterie
+        complexity = np.clip(1.0 + (shape_factor - 1.0) * 0.08, 1.0, 2.0)
         
-        try:
-            # Calcul du facteur de forme (périmètre/aire)
-            coordinates = []
-            for point in geometry:
-                if 'lat' in point and 'lon' in point:
-                    coordinates.append((point['lat'], point['lon']))
-            
-            if len(coordinates) < 3:
-                return 1.0
-            
-            # Calcul périmètre
-            perimeter = 0.0
-            for i in range(len(coordinates)):
-                j = (i + 1) % len(coordinates)
-                dx = coordinates[j][0] - coordinates[i][0]
-                dy = coordinates[j][1] - coordinates[i][1]
-                perimeter += math.sqrt(dx*dx + dy*dy)
-            
-            # Calcul aire
-            area = self._shoelace_area(coordinates)
-            
-            if area <= 0:
-                return 1.0
-            
-            # Facteur de forme (bâtiments allongés = distribution plus complexe)
-            shape_factor = perimeter / (2 * math.sqrt(math.pi * area))
-            
-            # Complexité distribution basée sur la forme
-            # Formes allongées nécessitent plus de tuyauterie
-            complexity = 1.0 + (shape_factor - 1.0) * 0.08
-            
-            return max(1.0, min(complexity, 2.0))
-            
-        except Exception:
-            return 1.0
+        return np.where(with_shape & (areas_deg > 0), complexity, 1.0)
     
-    def _calculate_building_water_capacity(self, building: Dict) -> float:
+    def _get_base_water_consumption_by_type(self, columns: WaterBuildingColumns) -> np.ndarray:
+        """Consommation de base (L/m²/jour) de chaque bâtiment selon son type"""
+        per_type = np.array([
+            MalaysiaConfig.get_building_type_config(building_type).get('base_water_consumption_l_m2_day', 150)
+            for building_type in columns.type_names
+        ], dtype=np.float64)
+        return per_type[columns.type_codes]
+    
+    def _generate_water_values(
+        self,
+        columns: WaterBuildingColumns,
+        base_consumptions: np.ndarray,
+        hours: np.ndarray,
+        days: np.ndarray,
+        months: np.ndarray,
+        water_values: np.ndarray
+    ) -> None:
         """
-        Calcule la capacité journalière d'eau du bâtiment
+        Calcule en place la consommation d'eau de tous les bâtiments
+        
+        Les facteurs horaires, journaliers, saisonniers et d'étages sont lus dans
+        des tables indexées par type (et nombre d'étages) et par heure/jour/mois,
+        puis combinés par blocs de bâtiments en opérations diffusées sur toute la
+        matrice bâtiments × points temporels.
         
         Args:
-            building: Données du bâtiment enrichi
-            
-        Returns:
-            float: Capacité journalière en litres
+            columns: Bâtiments enrichis, par colonnes
+            base_consumptions: Consommation de base horaire en litres de chaque bâtiment
+            hours: Heure (0-23) de chaque point temporel
+            days: Jour de la semaine (0-6) de chaque point temporel
+            months: Mois (1-12) de chaque point temporel
+            water_values: Matrice (bâtiments, points temporels) contenant la variation
+                aléatoire, remplacée par la consommation d'eau (litres)
         """
-        building_type = building['building_type']
-        precise_surface = building['precise_surface_area_m2']
-        floors_count = building['floors_count']
-        
-        # Consommation de base du type
-        config = MalaysiaConfig.get_building_type_config(building_type)
-        base_consumption_m2_day = config.get('base_water_consumption_l_m2_day', 150)
+        points_per_building = water_values.shape[1]
+        type_count = len(columns.type_names)
         
-        # Surface totale = surface sol × étages
-        total_floor_area = precise_surface * floors_count
+        # Tables de facteurs par type, et par couple (étages, type) présent
+        hourly_table = np.array([self._get_water_hourly_lut(t) for t in columns.type_names])
+        daily_table = np.array([self._get_water_daily_lut(t) for t in columns.type_names])
+        floors_keys, floors_codes = np.unique(
+            columns.floors_counts * type_count + columns.type_codes, return_inverse=True
+        )
+        floors_table = np.array([
+            self._get_floors_water_lut(key // type_count, columns.type_names[key % type_count])
+            for key in floors_keys.tolist()
+        ])
+        floors_codes = floors_codes.reshape(-1)
         
-        # Capacité de base
-        daily_capacity = base_consumption_m2_day * total_floor_area
+        # Facteurs développés sur la période: une ligne par type (ou couple)
+        hourly_series = hourly_table[:, hours]
+        daily_series = daily_table[:, days]
+        floors_series = floors_table[:, hours]
+        seasonal_factors = self._seasonal_lut[months - 1]
         
-        return daily_capacity
-    
-    def _generate_enhanced_building_water_series(
-        self, 
-        building: Dict, 
-        date_range: pd.DatetimeIndex,
-        frequency: str
-    ) -> List[Dict]:
-        """
-        Génère la série de consommation d'eau pour un bâtiment avec géométrie précise
+        # Facteur de pression (pertes dans les systèmes complexes)
+        pressure_efficiency_factors = 1.0 + (columns.pressure_needs - 1.0) * 0.02
         
-        Args:
-            building: Données du bâtiment enrichi
-            date_range: Index temporel
-            frequency: Fréquence d'échantillonnage
-            
-        Returns:
-            List[Dict]: Points de consommation d'eau
-        """
-        building_type = building['building_type']
-        precise_surface = building['precise_surface_area_m2']
-        floors_count = building['floors_count']
-        pressure_needs = building['water_pressure_needs']
-        distribution_complexity = building['distribution_complexity']
-        building_id = building['unique_id']
-        
-        # Consommation de base avec géométrie précise
-        base_water_consumption = self._calculate_enhanced_base_water_consumption(
-            building_type, precise_surface, floors_count, pressure_needs, distribution_complexity
-        )
+        # Facteur de distribution (pertes dans les systèmes complexes)
+        distribution_loss_factors = columns.distribution_complexities
         
-        water_points = []
+        # Consommation de base nulle: série nulle, aucun facteur à calculer
+        zero_base = base_consumptions == 0
+        water_values[zero_base] = 0.0
+        active = np.flatnonzero(~zero_base)
         
-        for timestamp in date_range:
-            # Facteurs de variation eau
-            hour_factor = self._get_water_hourly_factor(timestamp.hour, building_type)
-            day_factor = self._get_water_daily_factor(timestamp.dayofweek, building_type)
-            seasonal_factor = self._get_water_seasonal_factor(timestamp.month)
-            
-            # Facteurs spécifiques à l'eau multi-étages
-            floors_water_factor = self._get_floors_water_factor(timestamp.hour, floors_count, building_type)
-            
-            # Facteur de pression (pertes dans les systèmes complexes)
-            pressure_efficiency_factor = 1.0 + (pressure_needs - 1.0) * 0.02
+        # Blocs de bâtiments pour borner la taille des tableaux intermédiaires
+        chunk_size = max(1, _WATER_KERNEL_CHUNK_POINTS // max(points_per_building, 1))
+        for start in range(0, len(active), chunk_size):
+            rows = active[start:start + chunk_size]
+            row_types = columns.type_codes[rows]
             
-            # Facteur de distribution (pertes dans les systèmes complexes)
-            distribution_loss_factor = distribution_complexity
+            # Consommation finale eau enrichie (produits dans l'ordre du calcul
+            # par bâtiment: base, heure, jour, saison, étages, pression, distribution, aléa)
+            consumption = hourly_series.take(row_types, axis=0)
+            consumption *= base_consumptions[rows, None]
+            consumption *= daily_series.take(row_types, axis=0)
+            consumption *= seasonal_factors
+            consumption *= floors_series.take(floors_codes[rows], axis=0)
+            consumption *= pressure_efficiency_factors[rows, None]
+            consumption *= distribution_loss_factors[rows, None]
+            consumption *= water_values[rows]
             
-            # Variation aléatoire (plus élevée pour l'eau)
-            random_factor = np.random.normal(1.0, 0.15)
-            
-            # Consommation finale eau enrichie
-            water_consumption = (base_water_consumption * 
-                               hour_factor * 
-                               day_factor * 
-                               seasonal_factor * 
-                               floors_water_factor * 
-                               pressure_efficiency_factor * 
-                               distribution_loss_factor *
-                               random_factor)
-            
-            water_points.append({
-                'unique_id': building_id,
-                'timestamp': timestamp,
-                'y': max(0, water_consumption),
-                'frequency': frequency
-            })
-        
-        return water_points
+            water_values[rows] = np.maximum(0, consumption)
+    
+    def _get_water_hourly_lut(self, building_type: str) -> np.ndarray:
+        """Table des facteurs horaires (24 valeurs) pour un type de bâtiment"""
+        lut = self._hourly_lut.get(building_type)
+        if lut is None:
+            lut = np.array([self._get_water_hourly_factor(hour, building_type) for hour in range(24)])
+            self._hourly_lut[building_type] = lut
+        return lut
+    
+    def _get_water_daily_lut(self, building_type: str) -> np.ndarray:
+        """Table des facteurs par jour de semaine (7 valeurs) pour un type de bâtiment"""
+        lut = self._daily_lut.get(building_type)
+        if lut is None:
+            lut = np.array([self._get_water_daily_factor(day, building_type) for day in range(7)])
+            self._daily_lut[building_type] = lut
+        return lut
+    
+    def _get_floors_water_lut(self, floors_count: int, building_type: str) -> np.ndarray:
+        """Table des facteurs d'étages (24 valeurs) pour un couple (étages, type)"""
+        key = (floors_count, building_type)
+        lut = self._floors_lut.get(key)
+        if lut is None:
+            lut = np.array([self._get_floors_water_factor(hour, floors_count, building_type) for hour in range(24)])
+            self._floors_lut[key] = lut
+        return lut
     
     def _calculate_enhanced_base_water_consumption(
-        self, 
-        building_type: str, 
-        precise_surface: float, 
-        floors_count: int,
-        pressure_needs: float,
-        distribution_complexity: float
-    ) -> float:
+        self, columns: WaterBuildingColumns
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calcule la consommation d'eau de base améliorée avec géométrie
         
         Args:
-            building_type: Type de bâtiment
-            precise_surface: Surface précise en m²
-            floors_count: Nombre d'étages
-            pressure_needs: Besoins en pression
-            distribution_complexity: Complexité de distribution
+            columns: Bâtiments enrichis, par colonnes
             
         Returns:
-            float: Consommation de base horaire en litres
+            Tuple[np.ndarray, np.ndarray]: Consommation de base horaire et capacité
+            journalière (avant ajustements) en litres de chaque bâtiment
         """
+        floors_count = columns.floors_counts
+        
         # Consommation de base du type
-        config = MalaysiaConfig.get_building_type_config(building_type)
-        base_consumption_m2_day = config.get('base_water_consumption_l_m2_day', 150)
+        base_consumption_m2_day = self._get_base_water_consumption_by_type(columns)
         
         # Surface totale (planchers) = surface sol × étages
-        total_floor_area = precise_surface * floors_count
+        total_floor_area = columns.precise_surface_areas * floors_count
         
-        # Consommation de base
+        # Consommation de base (= capacité journalière du bâtiment)
         daily_consumption = base_consumption_m2_day * total_floor_area
         
         # Facteurs d'ajustement spécifiques à l'eau
         
         # 1. Facteur d'étages pour l'eau (différent de l'électricité)
-        if building_type == 'residential':
-            # Résidentiel: plus d'étages = plus de points d'eau
-            floors_efficiency = 1.0 + (floors_count - 1) * 0.1
-        elif building_type in ['office', 'commercial']:
-            # Bureau: plus d'étages = systèmes plus efficaces mais plus de points d'eau
-            floors_efficiency = 1.0 + (floors_count - 1) * 0.12
-        elif building_type == 'hospital':
-            # Hôpital: besoins très élevés par étage
-            floors_efficiency = 1.0 + (floors_count - 1) * 0.15
-        else:
-            floors_efficiency = 1.0 + (floors_count - 1) * 0.08
+        floors_rates = np.array([
+            _WATER_FLOORS_EFFICIENCY_RATES.get(building_type, 0.08)
+            for building_type in columns.type_names
+        ], dtype=np.float64)[columns.type_codes]
+        floors_efficiency = 1.0 + (floors_count - 1) * floors_rates
         
         # 2. Facteur de pression (surpression nécessaire)
-        pressure_factor = pressure_needs
+        pressure_factor = columns.pressure_needs
         
         # 3. Facteur de distribution (pertes selon complexité)
-        distribution_factor = distribution_complexity
+        distribution_factor = columns.distribution_complexities
         
-        # 4. Facteur de taille (économies d'échelle moins marquées pour l'eau)
-        if total_floor_area < 100:
-            size_factor = 1.05  # Petits bâtiments légèrement moins efficaces
-        elif total_floor_area > 10000:
-            size_factor = 0.95  # Gros bâtiments légèrement plus efficaces
-        else:
-            size_factor = 1.0
+        # 4. Facteur de taille (économies d'échelle moins marquées pour l'eau):
+        # petits bâtiments légèrement moins efficaces, gros légèrement plus
+        size_factor = np.where(total_floor_area < 100, 1.05,
+                               np.where(total_floor_area > 10000, 0.95, 1.0))
         
         # Application des facteurs
         adjusted_daily = (daily_consumption * 
@@ -531,7 +788,7 @@ class WaterGenerator:
         # Conversion en horaire
         hourly_consumption = adjusted_daily / 24
         
-        return hourly_consumption
+        return hourly_consumption, daily_consumption
     
     def _get_floors_water_factor(self, hour: int, floors_count: int, building_type: str) -> float:
         """
@@ -626,6 +883,111 @@ class WaterGenerator:
 # FONCTIONS UTILITAIRES POUR L'EAU
 # ==============================================================================
 
+@dataclass
+class WaterEfficiencyColumns:
+    """
+    Efficacité hydrique d'une liste de bâtiments, stockée par colonnes
+    
+    L'élément i de chaque tableau décrit le i-ème bâtiment valide (les entrées
+    vides sont ignorées); le type est encodé par son indice dans type_names et
+    la classe d'efficacité par son indice dans _WATER_EFFICIENCY_CLASSES.
+    """
+    
+    building_ids: List
+    has_precise_geometry: List
+    type_names: List[str]
+    type_codes: np.ndarray
+    floors_counts: np.ndarray
+    total_floor_areas: np.ndarray
+    theoretical_daily_liters: np.ndarray
+    actual_daily_liters: np.ndarray
+    geometry_efficiencies: np.ndarray
+    vertical_efficiencies: np.ndarray
+    type_efficiencies: np.ndarray
+    overall_efficiencies: np.ndarray
+    efficiency_class_codes: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.building_ids)
+
+
+def _batch_water_efficiency(buildings: List[Dict]) -> WaterEfficiencyColumns:
+    """
+    Calcule l'efficacité hydrique de tous les bâtiments en une passe vectorisée
+    
+    Mêmes règles que calculate_building_water_efficiency, sans arrondi.
+    
+    Args:
+        buildings: Liste des bâtiments avec géométrie
+        
+    Returns:
+        WaterEfficiencyColumns: Efficacité hydrique par colonnes
+    """
+    buildings = [building for building in buildings if building]
+    count = len(buildings)
+    
+    type_index = {}
+    type_codes = np.fromiter(
+        (type_index.setdefault(building.get('building_type', 'residential'), len(type_index))
+         for building in buildings),
+        dtype=np.int16, count=count
+    )
+    type_names = list(type_index)
+    floors_counts = np.fromiter(
+        (building.get('floors_count', 1) for building in buildings), dtype=np.float64, count=count
+    )
+    precise_surfaces = np.fromiter(
+        (building.get('precise_surface_area_m2', 100) for building in buildings), dtype=np.float64, count=count
+    )
+    has_geometry = [building.get('has_precise_geometry', False) for building in buildings]
+    distribution_complexities = np.fromiter(
+        (building.get('distribution_complexity', 1.0) if geometry else 1.0
+         for building, geometry in zip(buildings, has_geometry)),
+        dtype=np.float64, count=count
+    )
+    
+    # Intensité d'eau théorique (configuration lue une fois par type)
+    base_water_m2_day = np.array([
+        MalaysiaConfig.get_building_type_config(building_type).get('base_water_consumption_l_m2_day', 150)
+        for building_type in type_names
+    ], dtype=np.float64)[type_codes]
+    total_floor_areas = precise_surfaces * floors_counts
+    theoretical = base_water_m2_day * total_floor_areas
+    
+    # Facteurs d'efficacité: géométrie, étages, type
+    geometry_efficiencies = 1.0 / distribution_complexities
+    vertical_efficiencies = _VERTICAL_EFFICIENCIES_ARRAY[
+        np.searchsorted(_VERTICAL_EFFICIENCY_FLOORS, floors_counts, side='left')
+    ]
+    type_efficiencies = np.array([
+        _WATER_TYPE_EFFICIENCY.get(building_type, _DEFAULT_WATER_TYPE_EFFICIENCY) for building_type in type_names
+    ], dtype=np.float64)[type_codes]
+    
+    overall_efficiencies = geometry_efficiencies * vertical_efficiencies * type_efficiencies
+    
+    # Classification (0 = Excellent ... 3 = Médiocre)
+    efficiency_class_codes = (
+        len(_WATER_EFFICIENCY_THRESHOLDS)
+        - np.searchsorted(_WATER_EFFICIENCY_THRESHOLDS, overall_efficiencies, side='left')
+    ).astype(np.int8)
+    
+    return WaterEfficiencyColumns(
+        building_ids=[building.get('unique_id', 'unknown') for building in buildings],
+        has_precise_geometry=has_geometry,
+        type_names=type_names,
+        type_codes=type_codes,
+        floors_counts=floors_counts,
+        total_floor_areas=total_floor_areas,
+        theoretical_daily_liters=theoretical,
+        actual_daily_liters=theoretical / overall_efficiencies,
+        geometry_efficiencies=geometry_efficiencies,
+        vertical_efficiencies=vertical_efficiencies,
+        type_efficiencies=type_efficiencies,
+        overall_efficiencies=overall_efficiencies,
+        efficiency_class_codes=efficiency_class_codes
+    )
+
+
 def calculate_building_water_efficiency(building: Dict) -> Dict:
     """
     Calcule l'efficacité hydrique d'un bâtiment
@@ -660,25 +1022,12 @@ def calculate_building_water_efficiency(building: Dict) -> Dict:
     else:
         geometry_efficiency = 1.0
     
-    # 2. Efficacité verticale (étages)
-    if floors_count <= 2:
-        vertical_efficiency = 1.0  # Optimal
-    elif floors_count <= 5:
-        vertical_efficiency = 0.95  # Légères pertes
-    elif floors_count <= 10:
-        vertical_efficiency = 0.90  # Pertes modérées
-    else:
-        vertical_efficiency = 0.85  # Pertes importantes
+    # 2. Efficacité verticale (étages): optimale jusqu'à 2, puis pertes
+    # légères, modérées et importantes
+    vertical_efficiency = _VERTICAL_EFFICIENCIES[bisect_left(_VERTICAL_EFFICIENCY_FLOORS, floors_count)]
     
     # 3. Efficacité de type de bâtiment
-    type_efficiency = {
-        'residential': 0.85,    # Usage varié, moins optimisé
-        'office': 0.90,        # Usage prévisible
-        'commercial': 0.80,    # Usage intensif
-        'industrial': 0.75,    # Besoins process
-        'hospital': 0.70,      # Besoins sanitaires stricts
-        'school': 0.85         # Usage modéré et prévisible
-    }.get(building_type, 0.80)
+    type_efficiency = _WATER_TYPE_EFFICIENCY.get(building_type, _DEFAULT_WATER_TYPE_EFFICIENCY)
     
     # Efficacité globale
     overall_efficiency = geometry_efficiency * vertical_efficiency * type_efficiency
@@ -687,14 +1036,9 @@ def calculate_building_water_efficiency(building: Dict) -> Dict:
     actual_daily_consumption = theoretical_daily_consumption / overall_efficiency
     
     # Classification efficacité
-    if overall_efficiency > 0.9:
-        efficiency_class = 'Excellent'
-    elif overall_efficiency > 0.8:
-        efficiency_class = 'Bon'
-    elif overall_efficiency > 0.7:
-        efficiency_class = 'Moyen'
-    else:
-        efficiency_class = 'Médiocre'
+    efficiency_class = _WATER_EFFICIENCY_CLASSES[
+        len(_WATER_EFFICIENCY_THRESHOLDS) - bisect_left(_WATER_EFFICIENCY_THRESHOLDS, overall_efficiency)
+    ]
     
     return {
         'building_id': building.get('unique_id', 'unknown'),
@@ -722,12 +1066,22 @@ def calculate_building_water_efficiency(building: Dict) -> Dict:
     }
 
 
-def analyze_water_consumption_patterns(buildings: List[Dict]) -> Dict:
+def _codes_by_first_appearance(codes: np.ndarray) -> List[int]:
+    """Codes distincts d'un tableau, dans l'ordre de leur première apparition"""
+    unique_codes, first_indices = np.unique(codes, return_index=True)
+    return unique_codes[np.argsort(first_indices)].tolist()
+
+
+def analyze_water_consumption_patterns(
+    buildings: List[Dict],
+    efficiency: Optional[WaterEfficiencyColumns] = None
+) -> Dict:
     """
     Analyse les patterns de consommation d'eau d'une liste de bâtiments
     
     Args:
         buildings: Liste des bâtiments avec données eau
+        efficiency: Efficacité déjà calculée pour ces bâtiments (recalculée si absente)
         
     Returns:
         Dict: Analyse des patterns de consommation
@@ -735,51 +1089,54 @@ def analyze_water_consumption_patterns(buildings: List[Dict]) -> Dict:
     if not buildings:
         return {'error': 'Aucun bâtiment à analyser'}
     
-    # Initialisation
     total_buildings = len(buildings)
-    total_daily_consumption = 0
-    consumption_by_type = {}
-    consumption_by_floors = {}
-    efficiency_distribution = {}
-    
-    # Analyse par bâtiment
-    for building in buildings:
-        # Calcul efficacité
-        efficiency_data = calculate_building_water_efficiency(building)
-        
-        if 'error' not in efficiency_data:
-            building_type = efficiency_data['building_type']
-            floors = efficiency_data['floors_count']
-            daily_consumption = efficiency_data['water_consumption']['actual_daily_liters']
-            efficiency_class = efficiency_data['efficiency_class']
-            
-            # Accumulation totale
-            total_daily_consumption += daily_consumption
-            
-            # Par type de bâtiment
-            if building_type not in consumption_by_type:
-                consumption_by_type[building_type] = {
-                    'count': 0,
-                    'total_daily_liters': 0,
-                    'total_floor_area': 0
-                }
-            
-            consumption_by_type[building_type]['count'] += 1
-            consumption_by_type[building_type]['total_daily_liters'] += daily_consumption
-            consumption_by_type[building_type]['total_floor_area'] += efficiency_data['total_floor_area_m2']
-            
-            # Par nombre d'étages
-            floors_category = '1' if floors == 1 else '2-3' if floors <= 3 else '4-10' if floors <= 10 else '10+'
-            if floors_category not in consumption_by_floors:
-                consumption_by_floors[floors_category] = {
-                    'count': 0,
-                    'total_daily_liters': 0
-                }
-            consumption_by_floors[floors_category]['count'] += 1
-            consumption_by_floors[floors_category]['total_daily_liters'] += daily_consumption
-            
-            # Distribution efficacité
-            efficiency_distribution[efficiency_class] = efficiency_distribution.get(efficiency_class, 0) + 1
+    
+    # Efficacité de tous les bâtiments en une passe
+    if efficiency is None:
+        efficiency = _batch_water_efficiency(buildings)
+    daily_consumptions = np.round(efficiency.actual_daily_liters, 1)
+    floor_areas = np.round(efficiency.total_floor_areas, 1)
+    
+    # Accumulation totale
+    total_daily_consumption = float(daily_consumptions.sum())
+    
+    # Par type de bâtiment (codes dans l'ordre de première apparition)
+    type_count = len(efficiency.type_names)
+    type_counts = np.bincount(efficiency.type_codes, minlength=type_count).tolist()
+    type_liters = np.bincount(efficiency.type_codes, weights=daily_consumptions, minlength=type_count).tolist()
+    type_areas = np.bincount(efficiency.type_codes, weights=floor_areas, minlength=type_count).tolist()
+    consumption_by_type = {
+        building_type: {
+            'count': type_counts[code],
+            'total_daily_liters': type_liters[code],
+            'total_floor_area': type_areas[code]
+        }
+        for code, building_type in enumerate(efficiency.type_names)
+    }
+    
+    # Par nombre d'étages
+    floors = efficiency.floors_counts
+    floors_codes = np.select([floors == 1, floors <= 3, floors <= 10], [0, 1, 2], default=3)
+    floors_counts = np.bincount(floors_codes, minlength=len(_WATER_FLOORS_CATEGORIES)).tolist()
+    floors_liters = np.bincount(
+        floors_codes, weights=daily_consumptions, minlength=len(_WATER_FLOORS_CATEGORIES)
+    ).tolist()
+    consumption_by_floors = {
+        _WATER_FLOORS_CATEGORIES[code]: {
+            'count': floors_counts[code],
+            'total_daily_liters': floors_liters[code]
+        }
+        for code in _codes_by_first_appearance(floors_codes)
+    }
+    
+    # Distribution efficacité
+    class_counts = np.bincount(
+        efficiency.efficiency_class_codes, minlength=len(_WATER_EFFICIENCY_CLASSES)
+    ).tolist()
+    efficiency_distribution = {
+        _WATER_EFFICIENCY_CLASSES[code]: class_counts[code]
+        for code in _codes_by_first_appearance(efficiency.efficiency_class_codes)
+    }
     
     # Calcul des moyennes par type
     for btype, data in consumption_by_type.items():
@@ -830,56 +1187,61 @@ def generate_water_optimization_report(buildings: List[Dict]) -> Dict:
     if not buildings:
         return {'error': 'Aucun bâtiment à analyser'}
     
+    # Efficacité de tous les bâtiments, calculée une seule fois pour l'analyse
+    # de base et pour le potentiel d'économie
+    efficiency = _batch_water_efficiency(buildings)
+    
     # Analyse de base
-    patterns_analysis = analyze_water_consumption_patterns(buildings)
+    patterns_analysis = analyze_water_consumption_patterns(buildings, efficiency)
     
     if 'error' in patterns_analysis:
         return patterns_analysis
     
-    # Calcul du potentiel d'économie
-    total_savings_potential = 0
-    optimization_measures = {
-        'geometry_optimization': {'count': 0, 'potential_savings': 0},
-        'vertical_optimization': {'count': 0, 'potential_savings': 0},
-        'type_optimization': {'count': 0, 'potential_savings': 0}
-    }
-    
-    buildings_needing_optimization = []
+    # Bâtiments avec potentiel d'amélioration (facteurs arrondis comme dans le rapport)
+    needing = np.flatnonzero(np.round(efficiency.overall_efficiencies, 3) < 0.8)
+    savings = np.round(
+        efficiency.actual_daily_liters[needing] - efficiency.theoretical_daily_liters[needing], 1
+    )
+    total_savings_potential = float(savings.sum())
     
-    for building in buildings:
-        efficiency_data = calculate_building_water_efficiency(building)
-        
-        if 'error' not in efficiency_data:
-            overall_efficiency = efficiency_data['efficiency_factors']['overall_efficiency']
-            
-            if overall_efficiency < 0.8:  # Bâtiments avec potentiel d'amélioration
-                building_savings = efficiency_data['optimization_potential']['potential_daily_savings_liters']
-                total_savings_potential += building_savings
-                
-                buildings_needing_optimization.append({
-                    'building_id': efficiency_data['building_id'],
-                    'building_type': efficiency_data['building_type'],
-                    'efficiency_class': efficiency_data['efficiency_class'],
-                    'daily_savings_potential': building_savings,
-                    'efficiency_factors': efficiency_data['efficiency_factors']
-                })
-                
-                # Catégorisation des mesures
-                factors = efficiency_data['efficiency_factors']
-                if factors['geometry_efficiency'] < 0.9:
-                    optimization_measures['geometry_optimization']['count'] += 1
-                    optimization_measures['geometry_optimization']['potential_savings'] += building_savings * 0.3
-                
-                if factors['vertical_efficiency'] < 0.9:
-                    optimization_measures['vertical_optimization']['count'] += 1
-                    optimization_measures['vertical_optimization']['potential_savings'] += building_savings * 0.4
-                
-                if factors['type_efficiency'] < 0.8:
-                    optimization_measures['type_optimization']['count'] += 1
-                    optimization_measures['type_optimization']['potential_savings'] += building_savings * 0.3
+    # Catégorisation des mesures (facteur concerné, seuil, part des économies)
+    optimization_measures = {}
+    for measure, factors, threshold, savings_share in (
+        ('geometry_optimization', efficiency.geometry_efficiencies, 0.9, 0.3),
+        ('vertical_optimization', efficiency.vertical_efficiencies, 0.9, 0.4),
+        ('type_optimization', efficiency.type_efficiencies, 0.8, 0.3)
+    ):
+        affected = np.round(factors[needing], 3) < threshold
+        optimization_measures[measure] = {
+            'count': int(affected.sum()),
+            'potential_savings': float((savings[affected] * savings_share).sum())
+        }
     
-    # Tri par potentiel d'économie
-    buildings_needing_optimization.sort(key=lambda x: x['daily_savings_potential'], reverse=True)
+    # Top 10 par potentiel d'économie: sélection partielle des candidats (seuil
+    # du 10e plus grand, égalités incluses), puis tri stable de ces seuls candidats
+    # pour garder l'ordre d'origine à égalité
+    candidates = np.arange(len(savings))
+    if len(savings) > 10:
+        tenth_largest = -np.partition(-savings, 9)[9]
+        candidates = np.flatnonzero(savings >= tenth_largest)
+    priority_order = candidates[np.argsort(-savings[candidates], kind='stable')[:10]]
+    priority_buildings = []
+    for k in priority_order.tolist():
+        i = int(needing[k])
+        priority_buildings.append({
+            'building_id': efficiency.building_ids[i],
+            'building_type': efficiency.type_names[efficiency.type_codes[i]],
+            'efficiency_class': _WATER_EFFICIENCY_CLASSES[efficiency.efficiency_class_codes[i]],
+            'daily_savings_potential': round(
+                float(efficiency.actual_daily_liters[i] - efficiency.theoretical_daily_liters[i]), 1
+            ),
+            'efficiency_factors': {
+                'geometry_efficiency': round(float(efficiency.geometry_efficiencies[i]), 3),
+                'vertical_efficiency': round(float(efficiency.vertical_efficiencies[i]), 3),
+                'type_efficiency': round(float(efficiency.type_efficiencies[i]), 3),
+                'overall_efficiency': round(float(efficiency.overall_efficiencies[i]), 3)
+            }
+        })
     
     # Recommandations
     recommendations = []
@@ -918,15 +1280,15 @@ def generate_water_optimization_report(buildings: List[Dict]) -> Dict:
     return {
         'executive_summary': {
             'total_buildings_analyzed': len(buildings),
-            'buildings_needing_optimization': len(buildings_needing_optimization),
-            'optimization_rate_percent': round(len(buildings_needing_optimization) / len(buildings) * 100, 1),
+            'buildings_needing_optimization': len(needing),
+            'optimization_rate_percent': round(len(needing) / len(buildings) * 100, 1),
             'total_daily_savings_potential_liters': round(total_savings_potential, 1),
             'total_annual_savings_potential_m3': round(annual_savings_m3, 1),
             'estimated_annual_savings_myr': round(estimated_annual_savings_myr, 0)
         },
         'optimization_measures': optimization_measures,
         'recommendations': recommendations,
-        'priority_buildings': buildings_needing_optimization[:10],  # Top 10
+        'priority_buildings': priority_buildings,  # Top 10
         'patterns_analysis': patterns_analysis,
         'generated_at': datetime.now().isoformat(),
         'report_version': '1.0.0'
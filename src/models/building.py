@@ -7,17 +7,139 @@ MODÈLE BUILDING - STRUCTURES DE DONNÉES -
 Modèle de données pour les bâtiments Malaysia avec unique_id.
 """
 
+import math
+import sys
 import uuid
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
+import numpy as np
 
 from config import MalaysiaConfig
 from src.utils.helpers import (validate_malaysia_coordinates, generate_building_id, 
                               calculate_approximate_area, normalize_building_type)
 
 
-@dataclass
+def _normalize_profile(profile: List[float]) -> Tuple[float, ...]:
+    """Normalise un profil horaire (24 valeurs) pour que sa moyenne soit 1.0"""
+    avg_factor = sum(profile) / len(profile)
+    return tuple(f / avg_factor for f in profile)
+
+
+@lru_cache(maxsize=None)
+def _occupancy_hourly_profile(start_hour: int, end_hour: int) -> Tuple[float, ...]:
+    """Profil électrique horaire normalisé dérivé d'heures d'occupation"""
+    default_profile = []
+    for hour in range(24):
+        if start_hour <= hour <= end_hour:
+            default_profile.append(1.5)  # Heures actives
+        elif hour < start_hour or hour > end_hour + 2:
+            default_profile.append(0.3)  # Heures creuses
+        else:
+            default_profile.append(0.8)  # Transition
+    return _normalize_profile(default_profile)
+
+
+# Profils de consommation électrique horaire normalisés, par type
+# (les autres types sont dérivés de leurs heures d'occupation)
+_OFFICE_HOURLY_PROFILE = _normalize_profile([
+    0.1, 0.1, 0.1, 0.1, 0.1, 0.2,  # 0-5h: fermé
+    0.5, 1.0, 1.5, 1.8, 1.8, 1.5,  # 6-11h: ouverture
+    1.2, 1.5, 1.8, 1.8, 1.5, 1.0,  # 12-17h: activité
+    0.8, 0.5, 0.3, 0.2, 0.1, 0.1   # 18-23h: fermeture
+])
+_HOURLY_PROFILES = {
+    # Profil résidentiel Malaysia : pics matin et soir
+    'residential': _normalize_profile([
+        0.3, 0.3, 0.3, 0.3, 0.4, 0.6,  # 0-5h: nuit
+        1.2, 1.5, 1.0, 0.8, 0.7, 0.8,  # 6-11h: matin
+        1.0, 0.9, 0.8, 0.9, 1.0, 1.2,  # 12-17h: après-midi
+        1.5, 1.8, 1.6, 1.2, 0.8, 0.5   # 18-23h: soirée
+    ]),
+    # Profil bureau/commercial : heures de travail
+    'office': _OFFICE_HOURLY_PROFILE,
+    'commercial': _OFFICE_HOURLY_PROFILE,
+    # Profil industriel : plus constant
+    'industrial': _normalize_profile([
+        0.8, 0.8, 0.7, 0.7, 0.8, 1.0,  # 0-5h: garde réduite
+        1.3, 1.8, 2.0, 2.0, 1.8, 1.5,  # 6-11h: production
+        1.2, 1.5, 1.8, 2.0, 1.8, 1.5,  # 12-17h: production
+        1.2, 1.0, 0.9, 0.8, 0.8, 0.8   # 18-23h: réduction
+    ]),
+    # Profil hôpital : constant 24h/24
+    'hospital': _normalize_profile([1.0] * 24)
+}
+for _btype, _type_config in MalaysiaConfig.BUILDING_TYPES.items():
+    _HOURLY_PROFILES.setdefault(
+        _btype, _occupancy_hourly_profile(*_type_config.get('occupancy_hours', (8, 18)))
+    )
+
+# Profils de consommation d'eau horaire normalisés, par type
+_OFFICE_WATER_HOURLY_PROFILE = _normalize_profile([
+    0.1, 0.1, 0.1, 0.1, 0.1, 0.1,  # 0-5h: fermé
+    0.5, 1.0, 1.5, 1.8, 1.8, 2.0,  # 6-11h: ouverture
+    1.5, 1.8, 1.8, 1.5, 1.2, 1.0,  # 12-17h: activité
+    0.5, 0.2, 0.1, 0.1, 0.1, 0.1   # 18-23h: fermeture
+])
+_WATER_HOURLY_PROFILES = {
+    # Profil eau résidentiel : pics matin, midi, soir
+    'residential': _normalize_profile([
+        0.2, 0.2, 0.1, 0.1, 0.2, 0.5,  # 0-5h: nuit
+        2.0, 2.5, 1.5, 1.0, 0.8, 1.5,  # 6-11h: matin + douches
+        2.0, 1.5, 1.0, 1.0, 1.2, 1.5,  # 12-17h: midi + après-midi
+        2.2, 2.0, 1.8, 1.2, 0.8, 0.5   # 18-23h: soirée + bains
+    ]),
+    # Usage eau bureaux : constant pendant heures travail
+    'office': _OFFICE_WATER_HOURLY_PROFILE,
+    'commercial': _OFFICE_WATER_HOURLY_PROFILE,
+    # Hôpital : consommation eau plus constante 24h/24
+    'hospital': _normalize_profile([1.0 + 0.3 * math.sin((hour - 6) * math.pi / 12) for hour in range(24)])
+}
+_DEFAULT_WATER_HOURLY_PROFILE = _normalize_profile([
+    0.5, 0.4, 0.3, 0.3, 0.4, 0.8,
+    1.5, 1.8, 1.5, 1.2, 1.0, 1.3,
+    1.5, 1.2, 1.0, 1.2, 1.5, 1.8,
+    1.5, 1.2, 1.0, 0.8, 0.6, 0.5
+])
+
+
+# Nombre maximal de jeux de tags OSM distincts partagés entre bâtiments
+_SHARED_TAGS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_SHARED_TAGS_CACHE_SIZE)
+def _shared_tags_from_items(items: Tuple[Tuple, ...]) -> Dict:
+    """Dictionnaire de tags unique pour un contenu donné"""
+    return dict(items)
+
+
+def _share_osm_tags(tags: Dict) -> Dict:
+    """
+    Retourne un dictionnaire de tags partagé par tous les bâtiments ayant les mêmes tags
+    
+    Les tags OSM identiques sont très fréquents (ex: {'building': 'house'} pour
+    tout un lotissement); le dictionnaire retourné est partagé et ne doit pas
+    être modifié.
+    
+    Args:
+        tags: Tags OSM de l'élément
+        
+    Returns:
+        Dict: Tags partagés (ou les tags d'origine s'ils ne sont pas hachables)
+    """
+    try:
+        return _shared_tags_from_items(tuple(tags.items()))
+    except TypeError:
+        return tags
+
+
+# Instances sans __dict__ (dataclass slots, disponible depuis Python 3.10)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Building:
     """
     Modèle de données pour un bâtiment avec propriétés énergétiques
@@ -54,11 +176,15 @@ class Building:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
     
+    # created_at au format ISO, formaté une fois pour les exports
+    _created_at_iso: Optional[str] = field(init=False, default=None, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validation et calculs automatiques après création"""
         self._validate_coordinates()
         self._normalize_building_type()
         self._calculate_energy_properties()
+        self._created_at_iso = self.created_at.isoformat() if self.created_at else None
     
     def _validate_coordinates(self):
         """Valide que les coordonnées sont dans les limites Malaysia"""
@@ -110,6 +236,28 @@ class Building:
         
         return base_water * water_efficiency_factor * floors_factor
     
+    def calculate_daily_consumptions(self) -> Tuple[float, float]:
+        """
+        Calcule les consommations journalières électrique et d'eau en une fois
+        
+        Mêmes résultats que calculate_daily_consumption et
+        calculate_daily_water_consumption, le facteur d'efficacité n'étant lu
+        qu'une fois.
+        
+        Returns:
+            Tuple[float, float]: (électricité en kWh, eau en litres)
+        """
+        efficiency_factor = MalaysiaConfig.ENERGY_EFFICIENCY_CLASSES[self.energy_efficiency_class]['factor']
+        surface = self.surface_area_m2
+        extra_floors = self.floors_count - 1
+        
+        daily_electricity = (self.base_consumption_kwh_m2_day * surface
+                             * efficiency_factor * (1.0 + extra_floors * 0.1))
+        daily_water = (self.base_water_consumption_l_m2_day * surface
+                       * (1.0 - ((1.0 - efficiency_factor) * 0.3)) * (1.0 + extra_floors * 0.15))
+        
+        return daily_electricity, daily_water
+    
     def get_hourly_consumption_profile(self) -> List[float]:
         """
         Retourne le profil de consommation électrique horaire (24h)
@@ -117,54 +265,14 @@ class Building:
         Returns:
             List[float]: Facteurs multiplicateurs pour chaque heure (0-23)
         """
-        # Récupération des heures d'occupation depuis config
-        type_config = MalaysiaConfig.get_building_type_config(self.building_type)
-        occupancy_hours = type_config.get('occupancy_hours', (8, 18))
-        
-        if self.building_type == 'residential':
-            # Profil résidentiel Malaysia : pics matin et soir
-            profile = [
-                0.3, 0.3, 0.3, 0.3, 0.4, 0.6,  # 0-5h: nuit
-                1.2, 1.5, 1.0, 0.8, 0.7, 0.8,  # 6-11h: matin
-                1.0, 0.9, 0.8, 0.9, 1.0, 1.2,  # 12-17h: après-midi
-                1.5, 1.8, 1.6, 1.2, 0.8, 0.5   # 18-23h: soirée
-            ]
-        elif self.building_type in ['office', 'commercial']:
-            # Profil bureau/commercial : heures de travail
-            profile = [
-                0.1, 0.1, 0.1, 0.1, 0.1, 0.2,  # 0-5h: fermé
-                0.5, 1.0, 1.5, 1.8, 1.8, 1.5,  # 6-11h: ouverture
-                1.2, 1.5, 1.8, 1.8, 1.5, 1.0,  # 12-17h: activité
-                0.8, 0.5, 0.3, 0.2, 0.1, 0.1   # 18-23h: fermeture
-            ]
-        elif self.building_type == 'industrial':
-            # Profil industriel : plus constant
-            profile = [
-                0.8, 0.8, 0.7, 0.7, 0.8, 1.0,  # 0-5h: garde réduite
-                1.3, 1.8, 2.0, 2.0, 1.8, 1.5,  # 6-11h: production
-                1.2, 1.5, 1.8, 2.0, 1.8, 1.5,  # 12-17h: production
-                1.2, 1.0, 0.9, 0.8, 0.8, 0.8   # 18-23h: réduction
-            ]
-        elif self.building_type == 'hospital':
-            # Profil hôpital : constant 24h/24
-            profile = [1.0] * 24
-        else:
-            # Profil par défaut basé sur les heures d'occupation
-            start_hour, end_hour = occupancy_hours
-            profile = []
-            for hour in range(24):
-                if start_hour <= hour <= end_hour:
-                    profile.append(1.5)  # Heures actives
-                elif hour < start_hour or hour > end_hour + 2:
-                    profile.append(0.3)  # Heures creuses
-                else:
-                    profile.append(0.8)  # Transition
-        
-        # Normalisation pour que la moyenne soit 1.0
-        avg_factor = sum(profile) / len(profile)
-        normalized_profile = [f / avg_factor for f in profile]
-        
-        return normalized_profile
+        profile = _HOURLY_PROFILES.get(self.building_type)
+        
+        if profile is None:
+            # Type hors config: profil par défaut basé sur les heures d'occupation
+            type_config = MalaysiaConfig.get_building_type_config(self.building_type)
+            profile = _occupancy_hourly_profile(*type_config.get('occupancy_hours', (8, 18)))
+        
+        return list(profile)
     
     def get_water_hourly_profile(self) -> List[float]:
         """
@@ -173,41 +281,11 @@ class Building:
         Returns:
             List[float]: Facteurs multiplicateurs pour chaque heure (0-23)
         """
-        if self.building_type == 'residential':
-            # Profil eau résidentiel : pics matin, midi, soir
-            profile = [
-                0.2, 0.2, 0.1, 0.1, 0.2, 0.5,  # 0-5h: nuit
-                2.0, 2.5, 1.5, 1.0, 0.8, 1.5,  # 6-11h: matin + douches
-                2.0, 1.5, 1.0, 1.0, 1.2, 1.5,  # 12-17h: midi + après-midi
-                2.2, 2.0, 1.8, 1.2, 0.8, 0.5   # 18-23h: soirée + bains
-            ]
-        elif self.building_type in ['office', 'commercial']:
-            # Usage eau bureaux : constant pendant heures travail
-            profile = [
-                0.1, 0.1, 0.1, 0.1, 0.1, 0.1,  # 0-5h: fermé
-                0.5, 1.0, 1.5, 1.8, 1.8, 2.0,  # 6-11h: ouverture
-                1.5, 1.8, 1.8, 1.5, 1.2, 1.0,  # 12-17h: activité
-                0.5, 0.2, 0.1, 0.1, 0.1, 0.1   # 18-23h: fermeture
-            ]
-        elif self.building_type == 'hospital':
-            # Hôpital : consommation eau plus constante 24h/24
-            import math
-            profile = [1.0 + 0.3 * math.sin((hour - 6) * math.pi / 12) for hour in range(24)]
-        else:
-            # Profil par défaut
-            profile = [0.5, 0.4, 0.3, 0.3, 0.4, 0.8,
-                      1.5, 1.8, 1.5, 1.2, 1.0, 1.3,
-                      1.5, 1.2, 1.0, 1.2, 1.5, 1.8,
-                      1.5, 1.2, 1.0, 0.8, 0.6, 0.5]
-        
-        # Normalisation
-        avg_factor = sum(profile) / len(profile)
-        normalized_profile = [f / avg_factor for f in profile]
-        
-        return normalized_profile
+        return list(_WATER_HOURLY_PROFILES.get(self.building_type, _DEFAULT_WATER_HOURLY_PROFILE))
     
     def to_dict(self) -> Dict:
         """Convertit en dictionnaire pour export - VERSION MODIFIÉE"""
+        daily_electricity, daily_water = self.calculate_daily_consumptions()
         return {
             'unique_id': self.id,  # MODIFIÉ: unique_id au lieu de id
             'building_type': self.building_type,
@@ -217,11 +295,11 @@ class Building:
             'surface_area_m2': round(self.surface_area_m2, 1),
             'floors_count': self.floors_count,
             'energy_efficiency_class': self.energy_efficiency_class,
-            'daily_consumption_kwh': round(self.calculate_daily_consumption(), 2),
-            'daily_water_consumption_l': round(self.calculate_daily_water_consumption(), 1),
+            'daily_consumption_kwh': round(daily_electricity, 2),
+            'daily_water_consumption_l': round(daily_water, 1),
             'osm_id': self.osm_id,
             'source': self.source,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self._created_at_iso
         }
     
     @classmethod
@@ -258,7 +336,7 @@ class Building:
             zone_name=zone_name,
             building_type=building_type,
             surface_area_m2=surface_area,
-            osm_tags=tags,
+            osm_tags=_share_osm_tags(tags),
             source='openstreetmap'
         )
     
@@ -267,16 +345,16 @@ class Building:
         """Extrait coordonnées et surface depuis un élément OSM"""
         try:
             if hasattr(osm_element, 'geometry') and osm_element.geometry:
-                coords_list = []
-                
-                for geom in osm_element.geometry:
-                    if hasattr(geom, 'lat') and hasattr(geom, 'lon'):
-                        coords_list.append((geom.lat, geom.lon))
+                coords_list = [
+                    (geom.lat, geom.lon) for geom in osm_element.geometry
+                    if hasattr(geom, 'lat') and hasattr(geom, 'lon')
+                ]
                 
                 if coords_list:
                     # Centre géométrique
-                    center_lat = sum(c[0] for c in coords_list) / len(coords_list)
-                    center_lon = sum(c[1] for c in coords_list) / len(coords_list)
+                    lats, lons = zip(*coords_list)
+                    center_lat = sum(lats) / len(coords_list)
+                    center_lon = sum(lons) / len(coords_list)
                     
                     # Surface approximative (utilise helper centralisé)
                     surface_area = calculate_approximate_area(coords_list)
@@ -320,6 +398,118 @@ def create_building_from_coordinates(
     )
 
 
+# Facteurs d'efficacité énergétique indexés par code de classe (ordre de la config)
+_EFFICIENCY_CLASS_NAMES = tuple(MalaysiaConfig.ENERGY_EFFICIENCY_CLASSES)
+_EFFICIENCY_CLASS_CODES = {eff_class: code for code, eff_class in enumerate(_EFFICIENCY_CLASS_NAMES)}
+_EFFICIENCY_FACTORS = np.array(
+    [eff_config['factor'] for eff_config in MalaysiaConfig.ENERGY_EFFICIENCY_CLASSES.values()]
+)
+# Impact réduit de l'efficacité sur l'eau
+_WATER_EFFICIENCY_FACTORS = 1.0 - ((1.0 - _EFFICIENCY_FACTORS) * 0.3)
+
+
+@dataclass
+class BuildingArray:
+    """
+    Liste de bâtiments stockée par colonnes pour les calculs vectorisés
+    
+    L'élément i de chaque tableau décrit le bâtiment i; le type est encodé
+    par son indice dans type_names (ordre de première apparition) et la
+    classe d'efficacité par son indice dans _EFFICIENCY_FACTORS. Les codes sont
+    stockés sur int16/int8; surfaces et étages restent en float64 car ils
+    entrent dans le même calcul que les méthodes de Building.
+    """
+    
+    building_ids: List[str]
+    type_names: List[str]
+    type_codes: np.ndarray
+    efficiency_codes: np.ndarray
+    surfaces: np.ndarray
+    floors_counts: np.ndarray
+    base_consumptions: np.ndarray
+    base_water_consumptions: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.building_ids)
+    
+    @classmethod
+    def from_buildings(cls, buildings: List[Building]) -> 'BuildingArray':
+        """
+        Construit les colonnes depuis une liste de bâtiments
+        
+        Args:
+            buildings: Liste des bâtiments
+            
+        Returns:
+            BuildingArray: Colonnes des bâtiments
+        """
+        count = len(buildings)
+        type_indices = {}
+        
+        type_codes = np.fromiter(
+            (type_indices.setdefault(b.building_type, len(type_indices)) for b in buildings),
+            dtype=np.int16, count=count
+        )
+        efficiency_codes = np.fromiter(
+            (_EFFICIENCY_CLASS_CODES[b.energy_efficiency_class] for b in buildings),
+            dtype=np.int8, count=count
+        )
+        
+        return cls(
+            building_ids=[b.id for b in buildings],
+            type_names=list(type_indices),
+            type_codes=type_codes,
+            efficiency_codes=efficiency_codes,
+            surfaces=np.fromiter((b.surface_area_m2 for b in buildings), dtype=np.float64, count=count),
+            floors_counts=np.fromiter((b.floors_count for b in buildings), dtype=np.float64, count=count),
+            base_consumptions=np.fromiter(
+                (b.base_consumption_kwh_m2_day for b in buildings), dtype=np.float64, count=count
+            ),
+            base_water_consumptions=np.fromiter(
+                (b.base_water_consumption_l_m2_day for b in buildings), dtype=np.float64, count=count
+            )
+        )
+    
+    def daily_electricity(self) -> np.ndarray:
+        """
+        Consommation journalière électrique de base de chaque bâtiment
+        
+        Même calcul que Building.calculate_daily_consumption.
+        
+        Returns:
+            np.ndarray: Consommation journalière en kWh
+        """
+        floors_factors = 1.0 + (self.floors_counts - 1) * 0.1
+        return (self.base_consumptions * self.surfaces
+                * _EFFICIENCY_FACTORS[self.efficiency_codes] * floors_factors)
+    
+    def daily_water(self) -> np.ndarray:
+        """
+        Consommation journalière d'eau de base de chaque bâtiment
+        
+        Même calcul que Building.calculate_daily_water_consumption.
+        
+        Returns:
+            np.ndarray: Consommation journalière en litres
+        """
+        floors_factors = 1.0 + (self.floors_counts - 1) * 0.15
+        return (self.base_water_consumptions * self.surfaces
+                * _WATER_EFFICIENCY_FACTORS[self.efficiency_codes] * floors_factors)
+
+
+def compute_daily_consumption_batch(buildings: List[Building]) -> np.ndarray:
+    """
+    Calcule la consommation journalière électrique de base de plusieurs bâtiments
+    
+    Args:
+        buildings: Liste des bâtiments
+        
+    Returns:
+        np.ndarray: Consommation journalière en kWh de chaque bâtiment
+    """
+    return BuildingArray.from_buildings(buildings).daily_electricity()
+
+
 def validate_building_list(buildings: List[Building]) -> Dict:
     """
     Valide une liste de bâtiments
@@ -327,8 +517,19 @@ def validate_building_list(buildings: List[Building]) -> Dict:
     """
     from src.utils.validators import validate_building_list as validate_building_dict_list
     
-    # Conversion en dictionnaires pour validation
-    buildings_dicts = [building.to_dict() for building in buildings]
+    # Conversion en dictionnaires réduits aux champs lus par le validateur,
+    # arrondis comme dans to_dict (sans le calcul des consommations)
+    buildings_dicts = [
+        {
+            'unique_id': building.id,
+            'osm_id': building.osm_id,
+            'latitude': round(building.latitude, 6),
+            'longitude': round(building.longitude, 6),
+            'building_type': building.building_type,
+            'surface_area_m2': round(building.surface_area_m2, 1)
+        }
+        for building in buildings
+    ]
     
     return validate_building_dict_list(buildings_dicts)
 
@@ -376,8 +577,7 @@ def analyze_building_energy_potential(building: Building) -> Dict:
     Returns:
         Dict: Analyse énergétique complète
     """
-    daily_electricity = building.calculate_daily_consumption()
-    daily_water = building.calculate_daily_water_consumption()
+    daily_electricity, daily_water = building.calculate_daily_consumptions()
     
     # Intensités
     electricity_intensity = daily_electricity / building.surface_area_m2
@@ -435,12 +635,20 @@ def analyze_building_energy_potential(building: Building) -> Dict:
     }
 
 
-def get_building_type_statistics(buildings: List[Building]) -> Dict:
+def get_building_type_statistics(
+    buildings: List[Building],
+    columns: Optional[BuildingArray] = None,
+    daily_electricities: Optional[np.ndarray] = None,
+    daily_waters: Optional[np.ndarray] = None
+) -> Dict:
     """
     Calcule les statistiques par type de bâtiment
     
     Args:
         buildings: Liste des bâtiments
+        columns: Colonnes déjà construites pour ces bâtiments (construites si absentes)
+        daily_electricities: Consommations électriques journalières déjà calculées
+        daily_waters: Consommations d'eau journalières déjà calculées
         
     Returns:
         Dict: Statistiques par type
@@ -448,26 +656,36 @@ def get_building_type_statistics(buildings: List[Building]) -> Dict:
     if not buildings:
         return {}
     
-    type_stats = {}
-    
-    for building in buildings:
-        btype = building.building_type
-        
-        if btype not in type_stats:
-            type_stats[btype] = {
-                'count': 0,
-                'total_surface_m2': 0,
-                'total_daily_electricity': 0,
-                'total_daily_water': 0,
-                'buildings': []
-            }
-        
-        stats = type_stats[btype]
-        stats['count'] += 1
-        stats['total_surface_m2'] += building.surface_area_m2
-        stats['total_daily_electricity'] += building.calculate_daily_consumption()
-        stats['total_daily_water'] += building.calculate_daily_water_consumption()
-        stats['buildings'].append(building.id)
+    if columns is None:
+        columns = BuildingArray.from_buildings(buildings)
+    if daily_electricities is None:
+        daily_electricities = columns.daily_electricity()
+    if daily_waters is None:
+        daily_waters = columns.daily_water()
+    
+    type_count = len(columns.type_names)
+    
+    # Totaux par type en une passe (sommes cumulées dans l'ordre des bâtiments)
+    counts = np.bincount(columns.type_codes, minlength=type_count).tolist()
+    total_surfaces = np.bincount(
+        columns.type_codes, weights=columns.surfaces, minlength=type_count
+    ).tolist()
+    total_electricities = np.bincount(
+        columns.type_codes, weights=daily_electricities, minlength=type_count
+    ).tolist()
+    total_waters = np.bincount(
+        columns.type_codes, weights=daily_waters, minlength=type_count
+    ).tolist()
+    
+    type_stats = {
+        btype: {
+            'count': counts[code],
+            'total_surface_m2': total_surfaces[code],
+            'total_daily_electricity': total_electricities[code],
+            'total_daily_water': total_waters[code]
+        }
+        for code, btype in enumerate(columns.type_names)
+    }
     
     # Calcul des moyennes
     for btype, stats in type_stats.items():
@@ -478,9 +696,6 @@ def get_building_type_statistics(buildings: List[Building]) -> Dict:
             stats['average_daily_water'] = round(stats['total_daily_water'] / count, 1)
             stats['electricity_intensity'] = round(stats['total_daily_electricity'] / stats['total_surface_m2'], 3)
             stats['water_intensity'] = round(stats['total_daily_water'] / stats['total_surface_m2'], 1)
-        
-        # Nettoyage pour export
-        stats.pop('buildings', None)  # Evite les listes trop longues
     
     return type_stats
 
@@ -501,27 +716,31 @@ def generate_building_summary_report(buildings: List[Building]) -> Dict:
     # Statistiques générales
     total_count = len(buildings)
     total_surface = sum(b.surface_area_m2 for b in buildings)
-    total_daily_electricity = sum(b.calculate_daily_consumption() for b in buildings)
-    total_daily_water = sum(b.calculate_daily_water_consumption() for b in buildings)
+    columns = BuildingArray.from_buildings(buildings)
+    daily_electricities = columns.daily_electricity()
+    daily_waters = columns.daily_water()
+    total_daily_electricity = float(daily_electricities.sum())
+    total_daily_water = float(daily_waters.sum())
     
     # Répartition par zone
-    zone_distribution = {}
-    for building in buildings:
-        zone = building.zone_name or 'unknown'
-        zone_distribution[zone] = zone_distribution.get(zone, 0) + 1
+    zone_distribution = dict(Counter([b.zone_name or 'unknown' for b in buildings]))
     
     # Répartition par classe d'efficacité
-    efficiency_distribution = {}
-    for building in buildings:
-        eff_class = building.energy_efficiency_class
-        efficiency_distribution[eff_class] = efficiency_distribution.get(eff_class, 0) + 1
+    # (classes dans l'ordre de leur première apparition)
+    class_codes, first_indices, class_counts = np.unique(
+        columns.efficiency_codes, return_index=True, return_counts=True
+    )
+    order = np.argsort(first_indices)
+    efficiency_distribution = {
+        _EFFICIENCY_CLASS_NAMES[code]: count
+        for code, count in zip(class_codes[order].tolist(), class_counts[order].tolist())
+    }
     
     # Statistiques par type
-    type_statistics = get_building_type_statistics(buildings)
+    type_statistics = get_building_type_statistics(buildings, columns, daily_electricities, daily_waters)
     
     # Ranges et moyennes
-    surfaces = [b.surface_area_m2 for b in buildings]
-    electricities = [b.calculate_daily_consumption() for b in buildings]
+    surfaces = columns.surfaces
     
     return {
         'overview': {
@@ -529,8 +748,8 @@ def generate_building_summary_report(buildings: List[Building]) -> Dict:
             'total_surface_m2': round(total_surface, 1),
             'average_surface_m2': round(total_surface / total_count, 1),
             'surface_range': {
-                'min': round(min(surfaces), 1),
-                'max': round(max(surfaces), 1)
+                'min': round(float(surfaces.min()), 1),
+                'max': round(float(surfaces.max()), 1)
             }
         },
         'energy_summary': {
@@ -7,13 +7,142 @@ MODÈLE TIMESERIES - STRUCTURES DE DONNÉES
 Modèle de données pour les séries temporelles électriques avec métadonnées.
 """
 
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+# Flags calendaires indexés par jour de semaine (0 = lundi) et par heure
+_IS_WEEKEND_DAY = (False,) * 5 + (True,) * 2
+_IS_BUSINESS_HOUR = tuple(8 <= hour <= 18 for hour in range(24))
+
+# Heures de pointe par type de bâtiment (pointe générale pour les autres types)
+_PEAK_HOURS = {
+    # Pointes résidentielles: matin et soir
+    'residential': frozenset(range(6, 9)) | frozenset(range(18, 23)),
+    # Pointe bureaux: heures de travail
+    'office': frozenset(range(9, 18)),
+    'commercial': frozenset(range(9, 18)),
+    # Pointe industrielle: journée de travail
+    'industrial': frozenset(range(7, 20))
+}
+_DEFAULT_PEAK_HOURS = frozenset(range(8, 21))
+
+# Seuils de charge (kWh) base/medium et medium/peak par type de bâtiment
+_LOAD_THRESHOLDS = {
+    'residential': (0.5, 2.0),
+    'office': (1.0, 5.0),
+    'commercial': (1.0, 5.0)
+}
+_DEFAULT_LOAD_THRESHOLDS = (2.0, 10.0)  # industrial, hospital, etc.
+_LOAD_CLASSES = ('base', 'medium', 'peak')
+
+
+def _peak_and_load_columns(
+    consumptions: np.ndarray,
+    building_types: pd.Series,
+    hours: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Heure de pointe et classe de charge de chaque observation, par tables
+    
+    Args:
+        consumptions: Consommations en kWh
+        building_types: Types de bâtiment
+        hours: Heures (NaN si inconnue)
+        
+    Returns:
+        tuple: (flags heure de pointe, classes de charge)
+    """
+    # Codes de type; les valeurs manquantes (-1) pointent sur la ligne par défaut
+    type_codes, type_names = pd.factorize(building_types)
+    type_names = list(type_names)
+    
+    peak_hours = [_PEAK_HOURS.get(btype, _DEFAULT_PEAK_HOURS) for btype in type_names]
+    peak_hours.append(_DEFAULT_PEAK_HOURS)
+    peak_table = np.array([[hour in hours_set for hour in range(24)] for hours_set in peak_hours])
+    
+    thresholds = [_LOAD_THRESHOLDS.get(btype, _DEFAULT_LOAD_THRESHOLDS) for btype in type_names]
+    thresholds.append(_DEFAULT_LOAD_THRESHOLDS)
+    thresholds = np.array(thresholds)[type_codes]
+    
+    known_hours = ~np.isnan(hours)
+    hour_indices = np.where(known_hours, hours, 0).astype(np.intp)
+    is_peak = peak_table[type_codes, hour_indices] & known_hours
+    
+    # Nombre de seuils atteints (NaN compté comme au-delà, comme la version scalaire)
+    load_codes = (~(consumptions < thresholds[:, 0])).astype(np.intp) + ~(consumptions < thresholds[:, 1])
+    load_factors = np.array(_LOAD_CLASSES, dtype=object)[load_codes]
+    
+    return is_peak, load_factors
+
+
+def _quality_score_column(
+    consumptions: np.ndarray,
+    surfaces: np.ndarray,
+    building_types: np.ndarray,
+    hours: np.ndarray
+) -> np.ndarray:
+    """
+    Score de qualité de chaque observation, mêmes règles que _calculate_quality_score
+    
+    Les pénalités sont retranchées dans le même ordre que la version scalaire.
+    
+    Args:
+        consumptions: Consommations en kWh
+        surfaces: Surfaces en m²
+        building_types: Types de bâtiment
+        hours: Heures (NaN si inconnue)
+        
+    Returns:
+        np.ndarray: Scores entre 0 et 1
+    """
+    score = np.ones(len(consumptions))
+    
+    # Pénalités pour valeurs suspectes
+    score -= np.where(consumptions < 0, 0.5, np.where(consumptions == 0, 0.2, 0.0))
+    
+    # Vérification cohérence consommation/surface
+    with np.errstate(divide='ignore', invalid='ignore'):
+        consumption_per_m2 = consumptions / surfaces
+    has_surface = surfaces > 0
+    score -= np.where(has_surface & (consumption_per_m2 > 1.0), 0.2,
+                      np.where(has_surface & (consumption_per_m2 < 0.001), 0.1, 0.0))
+    
+    # Vérification cohérence type bâtiment / heure
+    night_office = (np.isin(building_types, ('office', 'commercial'))
+                    & (hours >= 2) & (hours <= 5) & (consumptions > 0.1))
+    score -= np.where(night_office, 0.1, 0.0)
+    
+    return np.clip(score, 0.0, 1.0)
+
+
+def _anomaly_flag_column(consumptions: np.ndarray, building_types: np.ndarray) -> np.ndarray:
+    """
+    Flag d'anomalie de chaque observation, mêmes règles que _detect_anomalies
+    
+    Args:
+        consumptions: Consommations en kWh
+        building_types: Types de bâtiment
+        
+    Returns:
+        np.ndarray: True pour les observations anormales
+    """
+    return ((consumptions < 0)
+            | (consumptions > 100)
+            | ((building_types == 'residential') & (consumptions > 20))
+            | ((building_types == 'industrial') & (consumptions < 0.1)))
+
+
+# Instances sans __dict__ (dataclass slots, disponible depuis Python 3.10)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TimeSeries:
     """
     Modèle de données pour un point temporel de consommation électrique
@@ -60,12 +189,16 @@ class TimeSeries:
     
     def _calculate_temporal_flags(self):
         """Calcule les flags temporels basés sur le timestamp"""
-        if isinstance(self.timestamp, pd.Timestamp):
-            self.hour = self.timestamp.hour
-            self.day_of_week = self.timestamp.dayofweek
-            self.month = self.timestamp.month
-            self.is_weekend = self.timestamp.dayofweek >= 5
-            self.is_business_hour = 8 <= self.timestamp.hour <= 18
+        timestamp = self.timestamp
+        if isinstance(timestamp, pd.Timestamp):
+            # Chaque attribut du Timestamp n'est lu qu'une fois
+            hour = timestamp.hour
+            day_of_week = timestamp.dayofweek
+            self.hour = hour
+            self.day_of_week = day_of_week
+            self.month = timestamp.month
+            self.is_weekend = _IS_WEEKEND_DAY[day_of_week]
+            self.is_business_hour = _IS_BUSINESS_HOUR[hour]
     
     def _calculate_quality_score(self):
         """Calcule un score de qualité des données (0-1)"""
@@ -133,18 +266,7 @@ class TimeSeries:
         if self.hour is None:
             return False
         
-        if self.building_type == 'residential':
-            # Pointes résidentielles: matin et soir
-            return (6 <= self.hour <= 8) or (18 <= self.hour <= 22)
-        elif self.building_type in ['office', 'commercial']:
-            # Pointe bureaux: heures de travail
-            return 9 <= self.hour <= 17
-        elif self.building_type == 'industrial':
-            # Pointe industrielle: journée de travail
-            return 7 <= self.hour <= 19
-        else:
-            # Pointe générale
-            return 8 <= self.hour <= 20
+        return self.hour in _PEAK_HOURS.get(self.building_type, _DEFAULT_PEAK_HOURS)
     
     def get_load_factor(self) -> str:
         """
@@ -153,27 +275,8 @@ class TimeSeries:
         Returns:
             str: Classe de charge ('base', 'medium', 'peak')
         """
-        if self.building_type == 'residential':
-            if self.consumption_kwh < 0.5:
-                return 'base'
-            elif self.consumption_kwh < 2.0:
-                return 'medium'
-            else:
-                return 'peak'
-        elif self.building_type in ['office', 'commercial']:
-            if self.consumption_kwh < 1.0:
-                return 'base'
-            elif self.consumption_kwh < 5.0:
-                return 'medium'
-            else:
-                return 'peak'
-        else:  # industrial, hospital, etc.
-            if self.consumption_kwh < 2.0:
-                return 'base'
-            elif self.consumption_kwh < 10.0:
-                return 'medium'
-            else:
-                return 'peak'
+        thresholds = _LOAD_THRESHOLDS.get(self.building_type, _DEFAULT_LOAD_THRESHOLDS)
+        return _LOAD_CLASSES[bisect_right(thresholds, self.consumption_kwh)]
     
     def to_dict(self) -> Dict:
         """Convertit en dictionnaire pour export"""
@@ -198,6 +301,46 @@ class TimeSeries:
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcule les champs dérivés de __post_init__ pour toutes les lignes d'un DataFrame
+        
+        Les flags temporels, le score de qualité et le flag d'anomalie sont
+        calculés par colonnes, sans créer de TimeSeries par ligne.
+        
+        Args:
+            df: DataFrame avec timestamp, consumption_kwh, building_type et surface_area_m2
+            
+        Returns:
+            pd.DataFrame: Copie du DataFrame complétée des colonnes hour, day_of_week,
+                month, is_weekend, is_business_hour, is_peak_hour, load_factor,
+                data_quality_score et anomaly_flag
+        """
+        frame = df.copy()
+        timestamps = pd.to_datetime(frame['timestamp'])
+        
+        # Flags temporels
+        frame['hour'] = timestamps.dt.hour
+        frame['day_of_week'] = timestamps.dt.dayofweek
+        frame['month'] = timestamps.dt.month
+        frame['is_weekend'] = frame['day_of_week'] >= 5
+        frame['is_business_hour'] = frame['hour'].between(8, 18)
+        
+        # Pointe, charge, qualité et anomalies
+        consumptions = frame['consumption_kwh'].to_numpy(dtype=np.float64)
+        surfaces = frame['surface_area_m2'].to_numpy(dtype=np.float64)
+        building_types = frame['building_type'].to_numpy(dtype=object)
+        hours = frame['hour'].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        frame['is_peak_hour'], frame['load_factor'] = _peak_and_load_columns(
+            consumptions, frame['building_type'], hours
+        )
+        frame['data_quality_score'] = _quality_score_column(consumptions, surfaces, building_types, hours)
+        frame['anomaly_flag'] = _anomaly_flag_column(consumptions, building_types)
+        
+        return frame
+    
     @classmethod
     def from_dict(cls, data: Dict) -> 'TimeSeries':
         """
@@ -229,6 +372,63 @@ class TimeSeries:
         )
 
 
+@dataclass
+class TimeSeriesBatch:
+    """
+    Lot d'observations de consommation stocké en DataFrame typé
+    
+    Alternative à une liste de TimeSeries pour les gros volumes: une ligne par
+    observation, champs dérivés inclus, sans objet Python par ligne. Un
+    TimeSeries n'est construit qu'à la demande pour inspecter une ligne.
+    """
+    
+    frame: pd.DataFrame
+    
+    def __len__(self) -> int:
+        return len(self.frame)
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'TimeSeriesBatch':
+        """
+        Crée un lot depuis un DataFrame d'observations
+        
+        Args:
+            df: DataFrame avec building_id, timestamp, consumption_kwh,
+                building_type et surface_area_m2
+            
+        Returns:
+            TimeSeriesBatch: Lot avec colonnes typées et champs dérivés
+                (building_id catégoriel, consommation float32, champs calendaires int8)
+        """
+        frame = df.copy()
+        frame['building_id'] = frame['building_id'].astype('category')
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        # float32 suffit pour une consommation horaire; les champs dérivés
+        # sont calculés sur la valeur stockée
+        frame['consumption_kwh'] = frame['consumption_kwh'].astype(np.float32)
+        
+        frame = TimeSeries.from_frame(frame)
+        
+        # Champs calendaires sur int8 (impossible si des timestamps manquent)
+        for column in ('hour', 'day_of_week', 'month'):
+            if not frame[column].isna().any():
+                frame[column] = frame[column].astype(np.int8)
+        
+        return cls(frame=frame)
+    
+    def to_timeseries(self, index: int) -> TimeSeries:
+        """
+        Construit le TimeSeries d'une ligne du lot
+        
+        Args:
+            index: Position de la ligne
+            
+        Returns:
+            TimeSeries: Observation correspondante
+        """
+        return TimeSeries.from_dict(self.frame.iloc[index].to_dict())
+
+
 # ==============================================================================
 # FONCTIONS UTILITAIRES
 # ==============================================================================
@@ -278,9 +478,10 @@ def dataframe_to_timeseries(df: pd.DataFrame) -> List[TimeSeries]:
     
     timeseries_list = []
     
-    for _, row in df.iterrows():
+    # Une ligne = un dict natif (pas de Series allouée par ligne comme avec iterrows)
+    for record in df.to_dict(orient='records'):
         try:
-            ts = TimeSeries.from_dict(row.to_dict())
+            ts = TimeSeries.from_dict(record)
             timeseries_list.append(ts)
         except Exception as e:
             # Log l'erreur mais continue
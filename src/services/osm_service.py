@@ -383,7 +383,7 @@ class EnhancedOSMService:
             'average_polygon_surface_m2': total_polygon_surface / len(buildings) if buildings else 0,
             'total_floors': total_floors,
             'average_floors': total_floors / len(buildings) if buildings else 0,
-            'most_common_type': max(type_counts.items(), key=lambda x: x[1])[0] if type_counts else 'unknown',
+            'most_common_type': max(type_counts, key=type_counts.get) if type_counts else 'unknown',
             'sample_based': sample_size < len(buildings),
             'enhanced_features': {
                 'with_precise_geometry': with_precise_geometry,
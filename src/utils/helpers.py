@@ -8,6 +8,7 @@ Fonctions utilitaires pour l'application Malaysia Electricity Generator.
 """
 
 import os
+import re
 import sys
 import uuid
 import logging
@@ -95,14 +96,13 @@ def calculate_approximate_area(coordinates: List[Tuple[float, float]]) -> float:
     
     try:
         # Formule shoelace pour calculer l'aire
-        n = len(coordinates)
         area_deg = 0.0
         
-        for i in range(n):
-            j = (i + 1) % n
-            if i < len(coordinates) and j < len(coordinates):
-                area_deg += coordinates[i][0] * coordinates[j][1]
-                area_deg -= coordinates[j][0] * coordinates[i][1]
+        # Chaque sommet avec le suivant (le dernier avec le premier)
+        next_coordinates = coordinates[1:] + coordinates[:1]
+        for (lat_i, lon_i), (lat_j, lon_j) in zip(coordinates, next_coordinates):
+            area_deg += lat_i * lon_j
+            area_deg -= lat_j * lon_i
         
         area_deg = abs(area_deg) / 2.0
         
@@ -151,6 +151,28 @@ def haversine_distance(coord1: Tuple[float, float], coord2: Tuple[float, float])
 # NORMALISATION DE DONNÉES
 # ==============================================================================
 
+# Types déjà normalisés (chacun est aussi le résultat de sa propre recherche
+# par mots-clés, d'où le raccourci), associés à leur chaîne partagée
+_CANONICAL_BUILDING_TYPES = {
+    building_type: building_type
+    for building_type in ('residential', 'commercial', 'office', 'industrial', 'school', 'hospital')
+}
+
+# Mots-clés de chaque type de bâtiment, compilés en une expression par type
+# (types testés dans cet ordre, le premier qui correspond l'emporte)
+_BUILDING_TYPE_PATTERNS = tuple(
+    (re.compile('|'.join(keywords)), building_type)
+    for keywords, building_type in (
+        (('house', 'home', 'residential', 'apartment'), 'residential'),
+        (('shop', 'store', 'retail', 'commercial'), 'commercial'),
+        (('office', 'government', 'civic'), 'office'),
+        (('factory', 'industrial', 'warehouse'), 'industrial'),
+        (('school', 'university', 'college'), 'school'),
+        (('hospital', 'clinic', 'medical'), 'hospital')
+    )
+)
+
+
 def normalize_building_type(raw_type: str) -> str:
     """
     Normalise un type de bâtiment
@@ -165,21 +187,17 @@ def normalize_building_type(raw_type: str) -> str:
         return 'residential'
     
     raw_lower = raw_type.lower().strip()
+    # Retourne la chaîne canonique plutôt que la copie en minuscules: tous les
+    # bâtiments d'un même type partagent le même objet str
+    canonical_type = _CANONICAL_BUILDING_TYPES.get(raw_lower)
+    if canonical_type is not None:
+        return canonical_type
     
-    if any(keyword in raw_lower for keyword in ['house', 'home', 'residential', 'apartment']):
-        return 'residential'
-    elif any(keyword in raw_lower for keyword in ['shop', 'store', 'retail', 'commercial']):
-        return 'commercial'
-    elif any(keyword in raw_lower for keyword in ['office', 'government', 'civic']):
-        return 'office'
-    elif any(keyword in raw_lower for keyword in ['factory', 'industrial', 'warehouse']):
-        return 'industrial'
-    elif any(keyword in raw_lower for keyword in ['school', 'university', 'college']):
-        return 'school'
-    elif any(keyword in raw_lower for keyword in ['hospital', 'clinic', 'medical']):
-        return 'hospital'
-    else:
-        return 'residential'
+    for pattern, building_type in _BUILDING_TYPE_PATTERNS:
+        if pattern.search(raw_lower):
+            return building_type
+    
+    return 'residential'
 
 
 def normalize_building_data(building: Dict) -> Dict:
@@ -17,6 +17,9 @@ from config import MalaysiaConfig, ExportConfig
 
 logger = logging.getLogger(__name__)
 
+# Types de bâtiments de la configuration, en minuscules
+_VALID_BUILDING_TYPES = frozenset(bt.lower() for bt in MalaysiaConfig.BUILDING_TYPES)
+
 
 # ==============================================================================
 # VALIDATEURS GÉOGRAPHIQUES
@@ -177,7 +180,7 @@ def validate_building_type(building_type: str) -> bool:
     if not building_type or not isinstance(building_type, str):
         return False
     
-    return building_type.lower() in [bt.lower() for bt in MalaysiaConfig.BUILDING_TYPES.keys()]
+    return building_type.lower() in _VALID_BUILDING_TYPES
 
 
 def validate_building_data(building: Dict) -> Dict:
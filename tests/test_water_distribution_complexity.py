@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+TESTS - COMPLEXITÉ DE DISTRIBUTION D'EAU
+=========================================
+
+Vérifie que le calcul par lot de la complexité de distribution reproduit
+le calcul bâtiment par bâtiment, pour des géométries en points dict,
+en points liste et mixtes.
+"""
+
+import math
+import unittest
+
+from src.core.water_generator import WaterGenerator
+
+
+def _reference_complexity(building, has_geometry):
+    """Calcul bâtiment par bâtiment de référence (points dict uniquement)"""
+    if not has_geometry:
+        return 1.0
+
+    geometry = building.get('geometry', [])
+    if len(geometry) < 4:
+        return 1.0
+
+    try:
+        coordinates = []
+        for point in geometry:
+            if 'lat' in point and 'lon' in point:
+                coordinates.append((point['lat'], point['lon']))
+
+        if len(coordinates) < 3:
+            return 1.0
+
+        perimeter = 0.0
+        area = 0.0
+        n = len(coordinates)
+        for i in range(n):
+            j = (i + 1) % n
+            dx = coordinates[j][0] - coordinates[i][0]
+            dy = coordinates[j][1] - coordinates[i][1]
+            perimeter += math.sqrt(dx*dx + dy*dy)
+            area += coordinates[i][0] * coordinates[j][1]
+            area -= coordinates[j][0] * coordinates[i][1]
+        area = abs(area) / 2.0
+
+        if area <= 0:
+            return 1.0
+
+        shape_factor = perimeter / (2 * math.sqrt(math.pi * area))
+        complexity = 1.0 + (shape_factor - 1.0) * 0.08
+
+        return max(1.0, min(complexity, 2.0))
+
+    except Exception:
+        return 1.0
+
+
+def _rectangle(lat, lon, height, width):
+    """Rectangle fermé (5 points) en (lat, lon)"""
+    return [
+        (lat, lon),
+        (lat, lon + width),
+        (lat + height, lon + width),
+        (lat + height, lon),
+        (lat, lon),
+    ]
+
+
+class TestDistributionComplexity(unittest.TestCase):
+    """Complexité par lot comparée au calcul de référence"""
+
+    def setUp(self):
+        self.generator = WaterGenerator()
+
+    def _assert_matches_reference(self, buildings):
+        columns = self.generator._preprocess_buildings_for_water(buildings)
+        for building, has_geometry, complexity in zip(
+            buildings, columns.has_precise_geometry, columns.distribution_complexities
+        ):
+            expected = _reference_complexity(building, has_geometry)
+            self.assertAlmostEqual(complexity, expected, places=9, msg=building['id'])
+
+    def test_dict_points(self):
+        buildings = [
+            {'id': 'carre', 'geometry': [
+                {'lat': lat, 'lon': lon} for lat, lon in _rectangle(3.1, 101.6, 0.0002, 0.0002)
+            ]},
+            {'id': 'allonge', 'geometry': [
+                {'lat': lat, 'lon': lon} for lat, lon in _rectangle(3.2, 101.7, 0.0001, 0.0012)
+            ]},
+            {'id': 'triangle', 'geometry': [
+                {'lat': 3.3, 'lon': 101.8}, {'lat': 3.3001, 'lon': 101.8}, {'lat': 3.3, 'lon': 101.8001}
+            ]},
+        ]
+        self._assert_matches_reference(buildings)
+
+    def test_list_points(self):
+        buildings = [
+            {'id': 'liste', 'geometry': [list(point) for point in _rectangle(3.1, 101.6, 0.0001, 0.001)]},
+            {'id': 'tuple', 'geometry': _rectangle(3.2, 101.7, 0.0003, 0.0001)},
+        ]
+        self._assert_matches_reference(buildings)
+
+        columns = self.generator._preprocess_buildings_for_water(buildings)
+        self.assertEqual(list(columns.distribution_complexities), [1.0, 1.0])
+        self.assertTrue(all(columns.has_precise_geometry))
+
+    def test_mixed_points(self):
+        rectangle = _rectangle(3.1, 101.6, 0.0001, 0.0015)
+        buildings = [
+            # Trois points dict sur cinq: forme calculée sur le triangle dict
+            {'id': 'mixte', 'geometry': [
+                {'lat': lat, 'lon': lon} if k < 3 else [lat, lon]
+                for k, (lat, lon) in enumerate(rectangle)
+            ]},
+            # Deux points dict seulement: forme non calculable
+            {'id': 'mixte_court', 'geometry': [
+                {'lat': lat, 'lon': lon} if k < 2 else (lat, lon)
+                for k, (lat, lon) in enumerate(rectangle)
+            ]},
+            {'id': 'dict', 'geometry': [
+                {'lat': lat, 'lon': lon} for lat, lon in _rectangle(3.2, 101.7, 0.0001, 0.0008)
+            ]},
+            {'id': 'texte', 'geometry': [
+                {'lat': str(lat), 'lon': str(lon)} for lat, lon in rectangle
+            ]},
+            {'id': 'sans_geometrie', 'geometry': []},
+        ]
+        self._assert_matches_reference(buildings)
+
+
+if __name__ == '__main__':
+    unittest.main()